@@ -162,6 +162,11 @@ ALL_TEST_CASES = (
 )
 
 
+def _is_valid_query(query: str) -> bool:
+    """Check whether a query would pass LookupRequest validation (non-blank)."""
+    return bool(query.strip())
+
+
 # ============================================================================
 # FIXTURES
 # ============================================================================
@@ -318,37 +323,36 @@ class TestAggregateMetrics:
         for category, cases in test_categories.items():
             results["by_category"][category] = {"total": 0, "correct": 0}
 
-            for query, expected_status, expected_match, min_conf, desc in cases:
-                if expected_status == "error":
-                    continue
+            # Validate up front instead of swallowing errors inside the loop;
+            # any exception raised below is a real bug and fails the test.
+            valid_cases = [
+                c for c in cases if c[1] != "error" and _is_valid_query(c[0])
+            ]
 
+            for query, expected_status, expected_match, min_conf, desc in valid_cases:
                 results["total"] += 1
                 results["by_category"][category]["total"] += 1
 
-                try:
-                    request = LookupRequest(
-                        company_name=query,
-                        fuzzy_threshold=50.0,
-                    )
-                    result = engine.lookup(request)
-
-                    # Check status
-                    if result.status.value == expected_status:
-                        results["correct_status"] += 1
-                        results["by_category"][category]["correct"] += 1
-
-                    # Check match
-                    if expected_match:
-                        if (
-                            result.best_match
-                            and result.best_match.matched_name == expected_match
-                        ):
-                            results["correct_match"] += 1
-                    elif result.best_match is None:
-                        results["correct_match"] += 1
+                request = LookupRequest(
+                    company_name=query,
+                    fuzzy_threshold=50.0,
+                )
+                result = engine.lookup(request)
 
-                except Exception:
-                    pass
+                # Check status
+                if result.status.value == expected_status:
+                    results["correct_status"] += 1
+                    results["by_category"][category]["correct"] += 1
+
+                # Check match
+                if expected_match:
+                    if (
+                        result.best_match
+                        and result.best_match.matched_name == expected_match
+                    ):
+                        results["correct_match"] += 1
+                elif result.best_match is None:
+                    results["correct_match"] += 1
 
         # Calculate metrics
         status_accuracy = results["correct_status"] / results["total"] * 100
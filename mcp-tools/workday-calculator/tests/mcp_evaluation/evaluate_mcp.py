@@ -5,16 +5,32 @@ This script evaluates how well LLMs can interpret natural language requests
 and correctly invoke the workday calculator MCP tool.
 """
 
+import asyncio
+import hashlib
 import json
 import os
+import re
+import sqlite3
 import sys
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import httpx
+import orjson
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
@@ -33,6 +49,29 @@ from datetime import date
 
 console = Console()
 
+# Default number of in-flight LLM requests per configuration
+DEFAULT_CONCURRENCY = 4
+
+# Worker threads for verifying extracted parameters with the calculator
+VERIFY_WORKERS = 4
+
+# Seconds between status polls of an Anthropic message batch
+BATCH_POLL_INTERVAL = 10.0
+
+# Retries with exponential backoff when an endpoint answers HTTP 429
+MAX_RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+
+ANTHROPIC_BASE_URL = "https://api.anthropic.com"
+
+# Connection pool settings shared by all LLM clients; idle connections are
+# kept alive so consecutive prompts skip the TCP/TLS handshake.
+CLIENT_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=16,
+    keepalive_expiry=60,
+)
+
 
 @dataclass
 class LLMConfig:
@@ -44,9 +83,11 @@ class LLMConfig:
     api_key: Optional[str] = None
     timeout: int = 120
     temperature: float = 0.0
+    rate_limit_rpm: Optional[int] = None  # None disables throttling (e.g. local Ollama)
+    use_batch_api: bool = False  # Anthropic only: submit all prompts as one message batch
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of a single test case."""
     prompt_id: str
@@ -63,9 +104,10 @@ class TestResult:
     response_time: float
     raw_response: str
     error: Optional[str] = None
+    from_cache: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationReport:
     """Overall evaluation report."""
     llm_name: str
@@ -78,6 +120,24 @@ class EvaluationReport:
     results: list = field(default_factory=list)
 
 
+# TestResult fields written to the final JSON report, in output order
+RESULT_EXPORT_FIELDS = (
+    "prompt_id",
+    "prompt",
+    "success",
+    "tool_called",
+    "parameters_extracted",
+    "expected",
+    "dates_correct",
+    "bundesland_correct",
+    "working_days_correct",
+    "response_time",
+    "from_cache",
+    "error",
+)
+_get_export_fields = attrgetter(*RESULT_EXPORT_FIELDS)
+
+
 # System prompt that explains available MCP tools
 SYSTEM_PROMPT = """You are an assistant with access to tools. When the user asks about working days, workdays, business days, or Arbeitstage in Germany, you MUST use the calculate_workdays tool.
 
@@ -130,39 +190,269 @@ Rules:
 """
 
 
+class RateLimiter:
+    """Async token bucket allowing ``rate`` requests per ``period`` seconds."""
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate,
+                    self._tokens + (now - self._updated) * self.rate / self.period,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+
+SYSTEM_PROMPT_HASH = hashlib.blake2b(SYSTEM_PROMPT.encode("utf-8")).hexdigest()
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / ".llm_cache.sqlite3"
+
+
+class ResponseCache:
+    """
+    Persistent exact-match cache of LLM responses backed by SQLite.
+
+    Entries are keyed by backend (API type and endpoint), model, temperature,
+    system prompt and user prompt.
+    Each entry keeps the latency of the original request, so cached runs
+    report comparable response times. Only deterministic (temperature 0)
+    requests are cached.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses "
+            "(key TEXT PRIMARY KEY, response TEXT NOT NULL, elapsed REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(config: LLMConfig, prompt: str) -> str:
+        """Build the cache key for a prompt sent with a given config."""
+        raw = (
+            f"{config.api_type}|{config.endpoint}|{config.model}|"
+            f"{config.temperature}|{SYSTEM_PROMPT_HASH}|{prompt}"
+        )
+        return hashlib.blake2b(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_cacheable(config: LLMConfig) -> bool:
+        """Whether responses for this config are deterministic enough to cache."""
+        return config.temperature == 0
+
+    def get(self, config: LLMConfig, prompt: str) -> Optional[tuple[str, float]]:
+        """Return the cached (response, original elapsed), or None on a miss."""
+        if not self.is_cacheable(config):
+            return None
+        row = self._conn.execute(
+            "SELECT response, elapsed FROM llm_responses WHERE key = ?",
+            (self.make_key(config, prompt),),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, config: LLMConfig, prompt: str, response: str, elapsed: float) -> None:
+        """Store a response together with the latency it took to produce."""
+        if not self.is_cacheable(config):
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO llm_responses (key, response, elapsed) VALUES (?, ?, ?)",
+            (self.make_key(config, prompt), response, elapsed),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+# Patterns used by extract_tool_call, in fallback order
+_JSON_PATTERNS = [
+    re.compile(pattern, re.DOTALL)
+    for pattern in (
+        r'```json\s*(.*?)\s*```',
+        r'```\s*(\{.*?\})\s*```',
+    )
+]
+
+# How deep _search_json_objects descends into objects that are not tool calls
+_MAX_JSON_SEARCH_DEPTH = 4
+_NESTED_RE = re.compile(
+    r'\{\s*"tool"\s*:\s*"[^"]+"\s*,\s*"parameters"\s*:\s*\{[^}]+\}\s*\}', re.DOTALL
+)
+_PARAMS_RE = re.compile(r'"parameters"\s*:\s*(\{[^}]+\})')
+_DATE_RE = re.compile(r'"(start_date|end_date)"\s*:\s*"(\d{4}-\d{2}-\d{2})"')
+_BL_RE = re.compile(r'"bundesland"\s*:\s*"([A-Z]{2})"')
+_PLZ_RE = re.compile(r'"postal_code"\s*:\s*"(\d{5})"')
+
+
+def safe_file_name(llm_name: str) -> str:
+    """Turn an LLM name into a string usable in file names."""
+    return llm_name.replace("/", "_").replace(" ", "_")
+
+
+def checkpoint_path(output_dir: Path, config: LLMConfig) -> Path:
+    """Path of the JSON Lines checkpoint for an in-progress config."""
+    return output_dir / f"eval_{safe_file_name(config.name)}.jsonl"
+
+
+def checkpoint_fingerprint(config: LLMConfig, test_cases: list[dict]) -> dict:
+    """Settings the results of a checkpoint depend on, stored in its header line."""
+    return {
+        "api_type": config.api_type,
+        "endpoint": config.endpoint,
+        "model": config.model,
+        "temperature": config.temperature,
+        "system_prompt": SYSTEM_PROMPT_HASH,
+        "prompts": hashlib.blake2b(orjson.dumps(test_cases)).hexdigest(),
+    }
+
+
+def load_checkpoint(path: Path, fingerprint: dict) -> dict[str, TestResult]:
+    """Load results recorded by an interrupted run, keyed by prompt_id.
+
+    Results that ended in an error are left out, so those prompts are retried.
+
+    Raises:
+        ValueError: If the checkpoint was written for other settings (model,
+            endpoint, system prompt or test prompts) than ``fingerprint``.
+    """
+    results = {}
+    if not path.exists() or path.stat().st_size == 0:
+        return results
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            header = orjson.loads(f.readline())
+        except orjson.JSONDecodeError:
+            header = None
+        if not isinstance(header, dict) or header.get("checkpoint") != fingerprint:
+            raise ValueError(
+                f"Checkpoint {path} was written for different settings or test "
+                f"prompts; delete it to start over"
+            )
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                result = TestResult(**orjson.loads(line))
+            except (orjson.JSONDecodeError, TypeError):
+                # Partially written last line from a crash
+                continue
+            if result.error is None:
+                results[result.prompt_id] = result
+
+    # Terminate a partially written last line so appended records stay parseable
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+    return results
+
+
 def load_test_prompts(path: Path) -> dict:
     """Load test prompts from JSON file."""
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def call_ollama(config: LLMConfig, prompt: str) -> tuple[str, float]:
+class PayloadTemplate:
+    """
+    Request body serialized once, with a slot for the user prompt.
+
+    The static parts (model, options and the multi-KB system prompt) are
+    encoded up front; rendering only encodes the prompt and joins bytes.
+    """
+
+    _SLOT = "\x00prompt\x00"
+
+    def __init__(self, payload_factory):
+        encoded = orjson.dumps(payload_factory(self._SLOT))
+        self._prefix, self._suffix = encoded.split(orjson.dumps(self._SLOT))
+
+    def render(self, prompt: str) -> bytes:
+        """Return the JSON request body for a prompt."""
+        return self._prefix + orjson.dumps(prompt) + self._suffix
+
+
+@lru_cache(maxsize=None)
+def payload_template(api_type: str, model: str, temperature: float) -> PayloadTemplate:
+    """Build (once per model and temperature) the request body template for an API."""
+    if api_type == "ollama":
+        return PayloadTemplate(lambda prompt: {
+            "model": model,
+            "prompt": prompt,
+            "system": SYSTEM_PROMPT,
+            "stream": False,
+            "options": {
+                "temperature": temperature,
+            }
+        })
+    elif api_type == "openai":
+        return PayloadTemplate(lambda prompt: {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+        })
+    elif api_type == "anthropic":
+        return PayloadTemplate(lambda prompt: {
+            "model": model,
+            "max_tokens": 1024,
+            "system": SYSTEM_PROMPT,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": temperature,
+        })
+    raise ValueError(f"Unknown API type: {api_type}")
+
+
+def render_payload(config: LLMConfig, prompt: str) -> bytes:
+    """Render the JSON request body for a prompt sent with a config."""
+    return payload_template(config.api_type, config.model, config.temperature).render(prompt)
+
+
+async def call_ollama(
+    client: httpx.AsyncClient, config: LLMConfig, prompt: str
+) -> tuple[str, float]:
     """Call Ollama API and return response and timing."""
     start_time = time.time()
 
-    payload = {
-        "model": config.model,
-        "prompt": prompt,
-        "system": SYSTEM_PROMPT,
-        "stream": False,
-        "options": {
-            "temperature": config.temperature,
-        }
-    }
-
-    with httpx.Client(timeout=config.timeout) as client:
-        response = client.post(
-            f"{config.endpoint}/api/generate",
-            json=payload,
-        )
-        response.raise_for_status()
+    response = await client.post(
+        "/api/generate",
+        content=render_payload(config, prompt),
+        headers={"Content-Type": "application/json"},
+        timeout=config.timeout,
+    )
+    response.raise_for_status()
 
     elapsed = time.time() - start_time
     result = response.json()
     return result.get("response", ""), elapsed
 
 
-def call_openai_compatible(config: LLMConfig, prompt: str) -> tuple[str, float]:
+async def call_openai_compatible(
+    client: httpx.AsyncClient, config: LLMConfig, prompt: str
+) -> tuple[str, float]:
     """Call OpenAI-compatible API (works with LM Studio, vLLM, etc.)."""
     start_time = time.time()
 
@@ -170,136 +460,371 @@ def call_openai_compatible(config: LLMConfig, prompt: str) -> tuple[str, float]:
     if config.api_key:
         headers["Authorization"] = f"Bearer {config.api_key}"
 
-    payload = {
-        "model": config.model,
-        "messages": [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": config.temperature,
-    }
-
-    with httpx.Client(timeout=config.timeout) as client:
-        response = client.post(
-            f"{config.endpoint}/v1/chat/completions",
-            json=payload,
-            headers=headers,
-        )
-        response.raise_for_status()
+    response = await client.post(
+        "/v1/chat/completions",
+        content=render_payload(config, prompt),
+        headers=headers,
+        timeout=config.timeout,
+    )
+    response.raise_for_status()
 
     elapsed = time.time() - start_time
     result = response.json()
     return result["choices"][0]["message"]["content"], elapsed
 
 
-def call_anthropic(config: LLMConfig, prompt: str) -> tuple[str, float]:
+async def call_anthropic(
+    client: httpx.AsyncClient, config: LLMConfig, prompt: str
+) -> tuple[str, float]:
     """Call Anthropic API."""
     start_time = time.time()
 
-    headers = {
+    headers = anthropic_headers(config)
+
+    response = await client.post(
+        "/v1/messages",
+        content=render_payload(config, prompt),
+        headers=headers,
+        timeout=config.timeout,
+    )
+    response.raise_for_status()
+
+    elapsed = time.time() - start_time
+    result = response.json()
+    return result["content"][0]["text"], elapsed
+
+
+def anthropic_headers(config: LLMConfig) -> dict:
+    """Request headers for the Anthropic API."""
+    return {
         "Content-Type": "application/json",
         "x-api-key": config.api_key,
         "anthropic-version": "2023-06-01",
     }
 
-    payload = {
-        "model": config.model,
-        "max_tokens": 1024,
-        "system": SYSTEM_PROMPT,
-        "messages": [
-            {"role": "user", "content": prompt}
-        ],
-        "temperature": config.temperature,
-    }
 
-    with httpx.Client(timeout=config.timeout) as client:
-        response = client.post(
-            "https://api.anthropic.com/v1/messages",
-            json=payload,
+async def call_anthropic_batch(
+    client: httpx.AsyncClient, config: LLMConfig, prompts: list[str]
+) -> dict[str, Union[tuple[str, float], Exception]]:
+    """
+    Send prompts through the Anthropic Message Batches API.
+
+    Batches are billed at a discount but may take minutes to complete, so
+    this is meant for runs where latency does not matter.
+
+    Returns: Mapping of prompt to (response, elapsed), or to the exception
+    describing why that request failed. ``elapsed`` is the batch duration.
+    """
+    start_time = time.time()
+    headers = anthropic_headers(config)
+
+    custom_ids = {f"prompt_{i:05d}": prompt for i, prompt in enumerate(prompts)}
+    requests = [
+        {
+            "custom_id": custom_id,
+            "params": {
+                "model": config.model,
+                "max_tokens": 1024,
+                "system": SYSTEM_PROMPT,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": config.temperature,
+            },
+        }
+        for custom_id, prompt in custom_ids.items()
+    ]
+
+    response = await client.post(
+        "/v1/messages/batches",
+        json={"requests": requests},
+        headers=headers,
+        timeout=config.timeout,
+    )
+    response.raise_for_status()
+    batch = response.json()
+
+    while batch["processing_status"] != "ended":
+        await asyncio.sleep(BATCH_POLL_INTERVAL)
+        response = await client.get(
+            f"/v1/messages/batches/{batch['id']}",
             headers=headers,
+            timeout=config.timeout,
         )
         response.raise_for_status()
+        batch = response.json()
 
+    response = await client.get(
+        batch["results_url"], headers=headers, timeout=config.timeout
+    )
+    response.raise_for_status()
     elapsed = time.time() - start_time
-    result = response.json()
-    return result["content"][0]["text"], elapsed
+
+    results: dict[str, Union[tuple[str, float], Exception]] = {}
+    for line in response.text.splitlines():
+        if not line.strip():
+            continue
+        entry = orjson.loads(line)
+        prompt = custom_ids.get(entry["custom_id"])
+        if prompt is None:
+            continue
+        result = entry["result"]
+        if result["type"] == "succeeded":
+            results[prompt] = (result["message"]["content"][0]["text"], elapsed)
+        else:
+            error = result.get("error", {}).get("message", result["type"])
+            results[prompt] = RuntimeError(f"Batch request {result['type']}: {error}")
+
+    for prompt in prompts:
+        results.setdefault(prompt, RuntimeError("No result returned by message batch"))
+    return results
+
+
+def client_base_url(config: LLMConfig) -> str:
+    """Return the base URL the HTTP client for a config is bound to."""
+    if config.api_type == "anthropic":
+        return ANTHROPIC_BASE_URL
+    return config.endpoint.rstrip("/")
+
+
+def use_http2(config: LLMConfig) -> bool:
+    """
+    Whether to negotiate HTTP/2 for a config's endpoint.
+
+    Cloud APIs benefit from multiplexing concurrent requests over one TLS
+    connection; local Ollama on loopback gains nothing and stays on HTTP/1.1.
+    """
+    return HTTP2_AVAILABLE and config.api_type in ("openai", "anthropic")
+
+
+def create_client(base_url: str, http2: bool = False) -> httpx.AsyncClient:
+    """
+    Create a pooled HTTP client bound to a single LLM endpoint.
+
+    Response compression (gzip/deflate, plus br/zstd when their decoders are
+    installed) is negotiated by httpx's default Accept-Encoding header.
+    """
+    return httpx.AsyncClient(base_url=base_url, limits=CLIENT_LIMITS, http2=http2)
 
 
-def call_llm(config: LLMConfig, prompt: str) -> tuple[str, float]:
+async def call_llm(
+    client: httpx.AsyncClient, config: LLMConfig, prompt: str
+) -> tuple[str, float]:
     """Call LLM based on API type."""
     if config.api_type == "ollama":
-        return call_ollama(config, prompt)
+        return await call_ollama(client, config, prompt)
     elif config.api_type == "openai":
-        return call_openai_compatible(config, prompt)
+        return await call_openai_compatible(client, config, prompt)
     elif config.api_type == "anthropic":
-        return call_anthropic(config, prompt)
+        return await call_anthropic(client, config, prompt)
     else:
         raise ValueError(f"Unknown API type: {config.api_type}")
 
 
+async def call_llm_with_retry(
+    client: httpx.AsyncClient,
+    config: LLMConfig,
+    prompt: str,
+    limiter: Optional[RateLimiter] = None,
+) -> tuple[str, float]:
+    """Call the LLM, respecting the rate limit and backing off on HTTP 429."""
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        if limiter is not None:
+            await limiter.acquire()
+        try:
+            return await call_llm(client, config, prompt)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            retry_after = e.response.headers.get("retry-after", "")
+            if retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = RATE_LIMIT_BACKOFF_SECONDS * 2 ** attempt
+            await asyncio.sleep(delay)
+    raise RuntimeError("unreachable")
+
+
+async def call_llm_cached(
+    client: httpx.AsyncClient,
+    config: LLMConfig,
+    prompt: str,
+    cache: Optional[ResponseCache],
+    limiter: Optional[RateLimiter] = None,
+    batch_responses: Optional[dict[str, Union[tuple[str, float], Exception]]] = None,
+) -> tuple[str, float, bool]:
+    """
+    Call the LLM, serving repeated prompts from the response cache.
+
+    If ``batch_responses`` is given, uncached prompts are answered from
+    those pre-fetched message batch results instead of a live request.
+
+    Returns: (response, elapsed, from_cache); for cache hits ``elapsed`` is
+    the latency of the original request.
+    """
+    if cache is not None:
+        cached = cache.get(config, prompt)
+        if cached is not None:
+            response, elapsed = cached
+            return response, elapsed, True
+
+    if batch_responses is not None:
+        batch_result = batch_responses.get(prompt)
+        if batch_result is None:
+            raise RuntimeError("Prompt was not part of the message batch")
+        if isinstance(batch_result, Exception):
+            raise batch_result
+        response, elapsed = batch_result
+    else:
+        response, elapsed = await call_llm_with_retry(client, config, prompt, limiter)
+
+    if cache is not None:
+        cache.set(config, prompt, response, elapsed)
+    return response, elapsed, False
+
+
+def _find_json_objects(
+    text: str, start: int = 0, end: Optional[int] = None
+) -> list[tuple[int, int]]:
+    """
+    Find the spans of balanced top-level {...} objects in ``text[start:end]``.
+
+    A single linear pass with a stack of open braces; string literals are
+    tracked inside objects so quoted braces do not affect nesting. Unlike the
+    previous regexes this handles nested objects and cannot backtrack.
+
+    Returns: ``(start, end)`` spans in order of appearance.
+    """
+    if end is None:
+        end = len(text)
+    open_braces: list[int] = []
+    spans: list[tuple[int, int]] = []
+    in_string = False
+    escaped = False
+    for i in range(start, end):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = bool(open_braces)
+        elif char == "{":
+            open_braces.append(i)
+        elif char == "}" and open_braces:
+            object_start = open_braces.pop()
+            # Objects closed earlier inside this one are not top-level
+            while spans and spans[-1][0] > object_start:
+                spans.pop()
+            spans.append((object_start, i + 1))
+    return spans
+
+
+def _search_json_objects(
+    text: str, start: int = 0, end: Optional[int] = None, depth: int = 0
+) -> Optional[dict]:
+    """Return the first object in text that parses as a tool call, searching nested objects too."""
+    for object_start, object_end in _find_json_objects(text, start, end):
+        parsed = _parse_tool_json(text[object_start:object_end])
+        if parsed is not None:
+            return parsed
+        if depth < _MAX_JSON_SEARCH_DEPTH:
+            parsed = _search_json_objects(text, object_start + 1, object_end - 1, depth + 1)
+            if parsed is not None:
+                return parsed
+    return None
+
+
+def _parse_tool_json(json_str: str) -> Optional[dict]:
+    """Parse a JSON string and return it if it looks like a tool call."""
+    try:
+        parsed = orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        return None
+    if isinstance(parsed, dict) and ("tool" in parsed or "parameters" in parsed):
+        return parsed
+    return None
+
+
+def _fast_extract_tool_call(response: str) -> Optional[dict]:
+    """Extract a tool call with plain string scanning, without regexes."""
+    # Fenced ```json block
+    fence_start = response.find("```json")
+    if fence_start != -1:
+        body_start = fence_start + len("```json")
+        fence_end = response.find("```", body_start)
+        if fence_end != -1:
+            parsed = _parse_tool_json(response[body_start:fence_end].strip())
+            if parsed is not None:
+                return parsed
+
+    # First balanced {...} object in the response
+    spans = _find_json_objects(response)
+    if spans:
+        object_start, object_end = spans[0]
+        return _parse_tool_json(response[object_start:object_end])
+
+    return None
+
+
 def extract_tool_call(response: str) -> Optional[dict]:
     """Extract tool call JSON from LLM response."""
-    import re
+    # Best case: the whole response is the JSON object, no regex needed
+    stripped = response.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        parsed = _parse_tool_json(stripped)
+        if parsed is not None:
+            return parsed
 
-    # Look for JSON block in various formats
-    json_patterns = [
-        r'```json\s*(.*?)\s*```',
-        r'```\s*(\{.*?\})\s*```',
-        r'(\{[^{}]*"tool"[^{}]*"parameters"[^{}]*\{[^{}]*\}[^{}]*\})',
-        r'(\{[^{}]*"parameters"[^{}]*\{[^{}]*\}[^{}]*\})',
-    ]
+    # Cheap string scan handles the common well-formed responses
+    parsed = _fast_extract_tool_call(response)
+    if parsed is not None:
+        return parsed
 
-    for pattern in json_patterns:
-        matches = re.findall(pattern, response, re.DOTALL)
+    # Look for JSON block in various formats
+    for pattern in _JSON_PATTERNS:
+        matches = pattern.findall(response)
         for match in matches:
             try:
                 if isinstance(match, str):
                     json_str = match.strip()
                     if not json_str.startswith("{"):
                         continue
-                    parsed = json.loads(json_str)
+                    parsed = orjson.loads(json_str)
                     if "tool" in parsed or "parameters" in parsed:
                         return parsed
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 continue
 
+    # Any other balanced object, including ones nested in non-tool JSON
+    parsed = _search_json_objects(response)
+    if parsed is not None:
+        return parsed
+
     # Try to find nested JSON with parameters object
-    nested_pattern = r'\{\s*"tool"\s*:\s*"[^"]+"\s*,\s*"parameters"\s*:\s*\{[^}]+\}\s*\}'
-    matches = re.findall(nested_pattern, response, re.DOTALL)
+    matches = _NESTED_RE.findall(response)
     for match in matches:
         try:
-            parsed = json.loads(match)
+            parsed = orjson.loads(match)
             return parsed
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             continue
 
     # Try to extract just the parameters if tool wrapper is missing
-    params_pattern = r'"parameters"\s*:\s*(\{[^}]+\})'
-    params_match = re.search(params_pattern, response)
+    params_match = _PARAMS_RE.search(response)
     if params_match:
         try:
-            params = json.loads(params_match.group(1))
+            params = orjson.loads(params_match.group(1))
             if "start_date" in params and "end_date" in params:
                 return {"tool": "calculate_workdays", "parameters": params}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
-    # Try parsing the entire response as JSON
-    try:
-        parsed = json.loads(response.strip())
-        if "tool" in parsed or "parameters" in parsed:
-            return parsed
-    except json.JSONDecodeError:
-        pass
-
     # Last resort: look for individual parameter values
-    date_pattern = r'"(start_date|end_date)"\s*:\s*"(\d{4}-\d{2}-\d{2})"'
-    bl_pattern = r'"bundesland"\s*:\s*"([A-Z]{2})"'
-    plz_pattern = r'"postal_code"\s*:\s*"(\d{5})"'
-
-    dates = dict(re.findall(date_pattern, response))
-    bl_match = re.search(bl_pattern, response)
-    plz_match = re.search(plz_pattern, response)
+    dates = dict(_DATE_RE.findall(response))
+    bl_match = _BL_RE.search(response)
+    plz_match = _PLZ_RE.search(response)
 
     if "start_date" in dates and "end_date" in dates and (bl_match or plz_match):
         params = {
@@ -315,6 +840,20 @@ def extract_tool_call(response: str) -> Optional[dict]:
     return None
 
 
+# Shared resolver; geocoding is disabled so resolution is deterministic
+_LOCATION_RESOLVER = LocationResolver(geocoding_enabled=False)
+
+
+@lru_cache(maxsize=1024)
+def resolve_plz_bundesland(postal_code: str) -> Optional[str]:
+    """Resolve a postal code to its Bundesland code, or None if unresolvable."""
+    try:
+        location = LocationInput(postal_code=postal_code)
+        return _LOCATION_RESOLVER.resolve(location).bundesland.value
+    except Exception:
+        return None
+
+
 def verify_result(
     extracted: dict,
     expected: dict,
@@ -343,13 +882,7 @@ def verify_result(
         bundesland_correct = True
     elif extracted_plz:
         # Resolve PLZ to bundesland
-        try:
-            location_resolver = LocationResolver(geocoding_enabled=False)
-            location = LocationInput(postal_code=extracted_plz)
-            resolved = location_resolver.resolve(location)
-            bundesland_correct = resolved.bundesland.value == expected_bl
-        except Exception:
-            pass
+        bundesland_correct = resolve_plz_bundesland(extracted_plz) == expected_bl
 
     # Calculate actual working days if parameters are valid
     actual_working_days = None
@@ -389,19 +922,40 @@ def verify_result(
     return dates_correct, bundesland_correct, working_days_correct, actual_working_days
 
 
-def run_evaluation(
+async def run_evaluation(
     configs: list[LLMConfig],
     test_data: dict,
     output_dir: Path,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: Optional[ResponseCache] = None,
 ) -> list[EvaluationReport]:
-    """Run evaluation across all LLM configs and test cases."""
+    """Run evaluation across all LLM configs and test cases.
+
+    All configs are evaluated concurrently. Within a config, test cases are
+    sent concurrently with at most ``concurrency`` requests in flight at any
+    time. If a ``cache`` is given, previously seen prompts are answered from
+    it instead of the LLM.
+
+    Each result is appended to a JSON Lines checkpoint in ``output_dir`` as
+    soon as it is available. If a run is interrupted, the next run skips the
+    prompts already answered there without an error, as long as the model,
+    endpoint, system prompt and test prompts are unchanged; the checkpoint is
+    removed once the final report has been saved.
+    """
 
-    # Initialize calculator
+    # Initialize calculator; one instance for the whole run so the holiday
+    # provider's cache is shared across all configs and test cases
     holiday_provider = HolidayProvider(language="de")
-    location_resolver = LocationResolver(geocoding_enabled=False)
-    calculator = WorkdayCalculator(holiday_provider, location_resolver)
+    calculator = WorkdayCalculator(holiday_provider, _LOCATION_RESOLVER)
 
-    reports = []
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Refuse stale checkpoints before any request is sent
+    for config in configs:
+        load_checkpoint(
+            checkpoint_path(output_dir, config),
+            checkpoint_fingerprint(config, test_data["test_cases"]),
+        )
 
     for config in configs:
         console.print(Panel(
@@ -411,105 +965,240 @@ def run_evaluation(
             title="LLM Configuration"
         ))
 
-        results = []
-        test_cases = test_data["test_cases"]
-
-        with Progress(
+    # One pooled client per endpoint, reused by every config that targets it
+    async with AsyncExitStack() as stack:
+        clients: dict[tuple[str, bool], httpx.AsyncClient] = {}
+        # Calculator checks run off the event loop so they overlap with LLM I/O
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=VERIFY_WORKERS))
+
+        for config in configs:
+            client_key = (client_base_url(config), use_http2(config))
+            if client_key not in clients:
+                clients[client_key] = await stack.enter_async_context(
+                    create_client(*client_key)
+                )
+
+        # A single progress display with one task per config
+        progress = stack.enter_context(Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TaskProgressColumn(),
             console=console,
-        ) as progress:
-            task = progress.add_task(
-                f"Testing {config.name}...",
-                total=len(test_cases)
+        ))
+
+        async def run_config(config: LLMConfig) -> EvaluationReport:
+            client = clients[(client_base_url(config), use_http2(config))]
+            report = await evaluate_config(
+                client, config, test_data["test_cases"], calculator, output_dir,
+                progress, concurrency, cache, executor,
             )
+            display_report_summary(report)
+            return report
 
-            for test_case in test_cases:
-                prompt_id = test_case["id"]
-                prompt = test_case["prompt"]
-                expected = test_case["expected"]
+        # gather() preserves input order, so reports line up with configs
+        reports = list(await asyncio.gather(*(run_config(config) for config in configs)))
 
-                try:
-                    response, elapsed = call_llm(config, prompt)
-                    extracted = extract_tool_call(response)
-
-                    tool_called = extracted is not None and extracted.get("tool") == "calculate_workdays"
-
-                    if tool_called and extracted:
-                        dates_ok, bl_ok, wd_ok, actual_wd = verify_result(
-                            extracted, expected, calculator
-                        )
-                    else:
-                        dates_ok, bl_ok, wd_ok, actual_wd = False, False, False, None
-
-                    result = TestResult(
-                        prompt_id=prompt_id,
-                        prompt=prompt,
-                        llm_name=config.name,
-                        model=config.model,
-                        success=tool_called and dates_ok and bl_ok,
-                        tool_called=tool_called,
-                        parameters_extracted=extracted or {},
-                        expected=expected,
-                        working_days_correct=wd_ok,
-                        bundesland_correct=bl_ok,
-                        dates_correct=dates_ok,
-                        response_time=elapsed,
-                        raw_response=response[:500],  # Truncate for storage
-                    )
+    # Save results
+    save_results(reports, output_dir)
+
+    # Results are persisted, so the checkpoints are no longer needed
+    for config in configs:
+        checkpoint_path(output_dir, config).unlink(missing_ok=True)
+
+    return reports
+
+
+async def evaluate_config(
+    client: httpx.AsyncClient,
+    config: LLMConfig,
+    test_cases: list[dict],
+    calculator: WorkdayCalculator,
+    output_dir: Path,
+    progress: Progress,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    cache: Optional[ResponseCache] = None,
+    executor: Optional[Executor] = None,
+) -> EvaluationReport:
+    """Evaluate all test cases against one LLM config and build its report."""
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(config.rate_limit_rpm) if config.rate_limit_rpm else None
+
+    checkpoint = checkpoint_path(output_dir, config)
+    fingerprint = checkpoint_fingerprint(config, test_cases)
+    completed = load_checkpoint(checkpoint, fingerprint)
+    pending = [tc for tc in test_cases if tc["id"] not in completed]
+    if completed:
+        console.print(
+            f"[blue]{config.name}: resuming from checkpoint, {len(completed)} of "
+            f"{len(test_cases)} test cases already done[/blue]"
+        )
+
+    task = progress.add_task(
+        f"Testing {config.name}...",
+        total=len(test_cases),
+        completed=len(test_cases) - len(pending),
+    )
 
+    batch_responses = None
+    if config.use_batch_api:
+        if config.api_type != "anthropic":
+            console.print(
+                f"[yellow]Batch API is only supported for Anthropic, "
+                f"sending {config.name} prompts individually[/yellow]"
+            )
+        else:
+            batch_prompts = [
+                tc["prompt"] for tc in pending
+                if cache is None or cache.get(config, tc["prompt"]) is None
+            ]
+            batch_responses = {}
+            if batch_prompts:
+                progress.update(
+                    task,
+                    description=f"{config.name}: waiting for message batch "
+                                f"of {len(batch_prompts)} prompts...",
+                )
+                try:
+                    batch_responses = await call_anthropic_batch(client, config, batch_prompts)
                 except Exception as e:
-                    result = TestResult(
-                        prompt_id=prompt_id,
-                        prompt=prompt,
-                        llm_name=config.name,
-                        model=config.model,
-                        success=False,
-                        tool_called=False,
-                        parameters_extracted={},
-                        expected=expected,
-                        working_days_correct=False,
-                        bundesland_correct=False,
-                        dates_correct=False,
-                        response_time=0,
-                        raw_response="",
-                        error=str(e),
-                    )
-
-                results.append(result)
-                progress.advance(task)
-
-                # Small delay to avoid rate limiting
-                time.sleep(0.5)
-
-        # Calculate metrics
-        total = len(results)
-        tool_calls = sum(1 for r in results if r.tool_called)
-        correct_params = sum(1 for r in results if r.success)
-        correct_results = sum(1 for r in results if r.working_days_correct)
-        avg_time = sum(r.response_time for r in results) / total if total > 0 else 0
-
-        report = EvaluationReport(
+                    batch_responses = {p: e for p in batch_prompts}
+                progress.update(task, description=f"Testing {config.name}...")
+
+    with open(checkpoint, "ab") as checkpoint_file:
+        if checkpoint_file.tell() == 0:
+            checkpoint_file.write(orjson.dumps({"checkpoint": fingerprint}) + b"\n")
+            checkpoint_file.flush()
+
+        async def evaluate_one(test_case: dict) -> TestResult:
+            async with semaphore:
+                result = await evaluate_test_case(
+                    client, config, test_case, calculator, cache, executor, limiter,
+                    batch_responses,
+                )
+            checkpoint_file.write(orjson.dumps(asdict(result)) + b"\n")
+            checkpoint_file.flush()
+            progress.advance(task)
+            return result
+
+        for result in await asyncio.gather(
+            *(evaluate_one(test_case) for test_case in pending)
+        ):
+            completed[result.prompt_id] = result
+
+    # Collect results in test file order and tally metrics in one pass
+    results = []
+    tool_calls = correct_params = correct_results = 0
+    total_time = 0.0
+    for test_case in test_cases:
+        result = completed[test_case["id"]]
+        results.append(result)
+        tool_calls += result.tool_called
+        correct_params += result.success
+        correct_results += result.working_days_correct
+        total_time += result.response_time
+
+    total = len(results)
+    avg_time = total_time / total if total > 0 else 0
+
+    return EvaluationReport(
+        llm_name=config.name,
+        model=config.model,
+        total_tests=total,
+        successful_tool_calls=tool_calls,
+        correct_parameters=correct_params,
+        correct_results=correct_results,
+        average_response_time=avg_time,
+        results=results,
+    )
+
+
+async def evaluate_test_case(
+    client: httpx.AsyncClient,
+    config: LLMConfig,
+    test_case: dict,
+    calculator: WorkdayCalculator,
+    cache: Optional[ResponseCache] = None,
+    executor: Optional[Executor] = None,
+    limiter: Optional[RateLimiter] = None,
+    batch_responses: Optional[dict[str, Union[tuple[str, float], Exception]]] = None,
+) -> TestResult:
+    """
+    Send a single test prompt to the LLM and score the response.
+
+    Verification runs in ``executor`` (the loop's default executor if None)
+    so it does not block other in-flight requests.
+    """
+    prompt_id = test_case["id"]
+    prompt = test_case["prompt"]
+    expected = test_case["expected"]
+
+    try:
+        response, elapsed, from_cache = await call_llm_cached(
+            client, config, prompt, cache, limiter, batch_responses
+        )
+        extracted = extract_tool_call(response)
+
+        tool_called = extracted is not None and extracted.get("tool") == "calculate_workdays"
+
+        if tool_called and extracted:
+            loop = asyncio.get_running_loop()
+            dates_ok, bl_ok, wd_ok, actual_wd = await loop.run_in_executor(
+                executor, verify_result, extracted, expected, calculator
+            )
+        else:
+            dates_ok, bl_ok, wd_ok, actual_wd = False, False, False, None
+
+        return TestResult(
+            prompt_id=prompt_id,
+            prompt=prompt,
             llm_name=config.name,
             model=config.model,
-            total_tests=total,
-            successful_tool_calls=tool_calls,
-            correct_parameters=correct_params,
-            correct_results=correct_results,
-            average_response_time=avg_time,
-            results=results,
+            success=tool_called and dates_ok and bl_ok,
+            tool_called=tool_called,
+            parameters_extracted=extracted or {},
+            expected=expected,
+            working_days_correct=wd_ok,
+            bundesland_correct=bl_ok,
+            dates_correct=dates_ok,
+            response_time=elapsed,
+            raw_response=response[:500],  # Truncate for storage
+            from_cache=from_cache,
         )
-        reports.append(report)
 
-        # Display summary
-        display_report_summary(report)
+    except Exception as e:
+        return TestResult(
+            prompt_id=prompt_id,
+            prompt=prompt,
+            llm_name=config.name,
+            model=config.model,
+            success=False,
+            tool_called=False,
+            parameters_extracted={},
+            expected=expected,
+            working_days_correct=False,
+            bundesland_correct=False,
+            dates_correct=False,
+            response_time=0,
+            raw_response="",
+            error=str(e),
+        )
 
-    # Save results
-    save_results(reports, output_dir)
 
-    return reports
+RATE_METRICS = (
+    ("tool_call_rate", attrgetter("successful_tool_calls")),
+    ("parameter_accuracy", attrgetter("correct_parameters")),
+    ("result_accuracy", attrgetter("correct_results")),
+)
+
+
+def report_rates(report: EvaluationReport) -> dict[str, float]:
+    """Compute all per-report rates in one pass (0.0 for an empty report)."""
+    total = report.total_tests
+    return {
+        name: (count(report) / total if total else 0.0)
+        for name, count in RATE_METRICS
+    }
 
 
 def display_report_summary(report: EvaluationReport):
@@ -520,27 +1209,27 @@ def display_report_summary(report: EvaluationReport):
     table.add_column("Value", style="green")
     table.add_column("Percentage", style="yellow")
 
-    total = report.total_tests
+    rates = report_rates(report)
 
     table.add_row(
         "Total Tests",
-        str(total),
+        str(report.total_tests),
         "100%"
     )
     table.add_row(
         "Tool Called Correctly",
         str(report.successful_tool_calls),
-        f"{report.successful_tool_calls/total*100:.1f}%"
+        f"{rates['tool_call_rate']*100:.1f}%"
     )
     table.add_row(
         "Parameters Correct",
         str(report.correct_parameters),
-        f"{report.correct_parameters/total*100:.1f}%"
+        f"{rates['parameter_accuracy']*100:.1f}%"
     )
     table.add_row(
         "Working Days Correct",
         str(report.correct_results),
-        f"{report.correct_results/total*100:.1f}%"
+        f"{rates['result_accuracy']*100:.1f}%"
     )
     table.add_row(
         "Avg Response Time",
@@ -573,8 +1262,7 @@ def save_results(reports: list[EvaluationReport], output_dir: Path):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     for report in reports:
-        safe_name = report.llm_name.replace("/", "_").replace(" ", "_")
-        output_file = output_dir / f"eval_{safe_name}_{timestamp}.json"
+        output_file = output_dir / f"eval_{safe_file_name(report.llm_name)}_{timestamp}.json"
 
         # Convert to dict
         report_dict = {
@@ -587,30 +1275,18 @@ def save_results(reports: list[EvaluationReport], output_dir: Path):
                 "correct_parameters": report.correct_parameters,
                 "correct_results": report.correct_results,
                 "average_response_time": report.average_response_time,
-                "tool_call_rate": report.successful_tool_calls / report.total_tests,
-                "parameter_accuracy": report.correct_parameters / report.total_tests,
-                "result_accuracy": report.correct_results / report.total_tests,
+                **report_rates(report),
             },
             "results": [
-                {
-                    "prompt_id": r.prompt_id,
-                    "prompt": r.prompt,
-                    "success": r.success,
-                    "tool_called": r.tool_called,
-                    "parameters_extracted": r.parameters_extracted,
-                    "expected": r.expected,
-                    "dates_correct": r.dates_correct,
-                    "bundesland_correct": r.bundesland_correct,
-                    "working_days_correct": r.working_days_correct,
-                    "response_time": r.response_time,
-                    "error": r.error,
-                }
+                dict(zip(RESULT_EXPORT_FIELDS, _get_export_fields(r)))
                 for r in report.results
             ],
         }
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(report_dict, f, indent=2, ensure_ascii=False)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(
+                report_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
 
         console.print(f"[green]Results saved to: {output_file}[/green]")
 
@@ -630,13 +1306,11 @@ def display_comparison_table(reports: list[EvaluationReport]):
     table.add_column("Avg Time", justify="right")
 
     for report in reports:
-        total = report.total_tests
+        rates = report_rates(report)
         table.add_row(
             report.llm_name,
             report.model[:20],
-            f"{report.successful_tool_calls/total*100:.1f}%",
-            f"{report.correct_parameters/total*100:.1f}%",
-            f"{report.correct_results/total*100:.1f}%",
+            *(f"{rates[name]*100:.1f}%" for name, _ in RATE_METRICS),
             f"{report.average_response_time:.2f}s",
         )
 
@@ -711,6 +1385,33 @@ def main():
         type=str,
         help="Anthropic model name (requires ANTHROPIC_API_KEY env var)"
     )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Send Anthropic prompts via the Message Batches API (cheaper, slower)"
+    )
+    parser.add_argument(
+        "--rate-limit-rpm",
+        type=int,
+        help="Requests per minute for OpenAI-compatible and Anthropic endpoints"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the LLMs instead of reusing cached responses"
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help="Path to the response cache database"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum concurrent requests per LLM (default: {DEFAULT_CONCURRENCY})"
+    )
 
     args = parser.parse_args()
 
@@ -748,6 +1449,7 @@ def main():
             endpoint=args.openai_endpoint,
             model=args.openai_model,
             api_type="openai",
+            rate_limit_rpm=args.rate_limit_rpm,
         ))
 
     # Add Anthropic if specified
@@ -762,6 +1464,8 @@ def main():
                 model=args.anthropic_model,
                 api_type="anthropic",
                 api_key=api_key,
+                rate_limit_rpm=args.rate_limit_rpm,
+                use_batch_api=args.batch_api,
             ))
 
     if not configs:
@@ -771,7 +1475,17 @@ def main():
     console.print(f"[blue]Testing {len(configs)} LLM configuration(s)[/blue]")
 
     # Run evaluation
-    reports = run_evaluation(configs, test_data, args.output_dir)
+    cache = None if args.no_cache else ResponseCache(args.cache_path)
+    try:
+        reports = asyncio.run(
+            run_evaluation(configs, test_data, args.output_dir, args.concurrency, cache)
+        )
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        return 1
+    finally:
+        if cache is not None:
+            cache.close()
 
     # Show comparison
     display_comparison_table(reports)
@@ -14,6 +14,7 @@ from workday_calculator.data.schemas import (
     LocationInput,
     WorkdayRequest,
 )
+from workday_calculator.output.response import RESPONSE_FIELDS, workday_response
 
 
 @pytest.fixture
@@ -62,6 +63,79 @@ class TestHolidayProvider:
         # Bayern should have more holidays (e.g., Heilige Drei Koenige, Fronleichnam)
         assert len(bayern_holidays) > len(hamburg_holidays)
 
+    def test_get_holidays_for_year_is_cached(self, holiday_provider):
+        """Test that repeated year lookups reuse the cached list."""
+        first = holiday_provider.get_holidays_for_year(2026, Bundesland.HH)
+        second = holiday_provider.get_holidays_for_year(2026, Bundesland.HH)
+        assert first is second
+
+        holiday_provider.clear_cache()
+        assert holiday_provider.get_holidays_for_year(2026, Bundesland.HH) is not first
+
+    def test_holiday_cache_file_roundtrip(self, tmp_path):
+        """Test that computed holiday years are reloaded from the cache file."""
+        cache_file = tmp_path / "holidays.json"
+        first = HolidayProvider(language="de", cache_file=str(cache_file))
+        expected = first.get_holidays_for_year(2026, Bundesland.BY)
+        assert not cache_file.exists()
+        first.flush_cache()
+        assert cache_file.exists()
+
+        second = HolidayProvider(language="de", cache_file=str(cache_file))
+        assert second.get_holidays_for_year(2026, Bundesland.BY) == expected
+
+    def test_holiday_cache_file_invalid(self, tmp_path):
+        """Test that an unreadable cache file is ignored."""
+        cache_file = tmp_path / "holidays.json"
+        cache_file.write_bytes(b"\x80\x04not json")
+        provider = HolidayProvider(language="de", cache_file=str(cache_file))
+
+        assert len(provider.get_holidays_for_year(2026, Bundesland.BY)) > 0
+        assert len(provider._get_disk_cache()) == 1
+
+    def test_warm_up(self, tmp_path):
+        """Test that warm_up precomputes all states and writes the cache once."""
+        cache_file = tmp_path / "holidays.json"
+        provider = HolidayProvider(language="de", cache_file=str(cache_file))
+        provider.warm_up([2026])
+
+        assert len(provider._cache) == len(Bundesland)
+        assert len(HolidayProvider(cache_file=str(cache_file))._get_disk_cache()) == len(Bundesland)
+
+    def test_clear_cache_resets_disk_cache(self, tmp_path):
+        """Test that clear_cache also drops the persisted years held in memory."""
+        provider = HolidayProvider(language="de", cache_file=str(tmp_path / "holidays.json"))
+        provider.get_holidays_for_year(2026, Bundesland.BY)
+        assert provider._disk_cache
+
+        provider.clear_cache()
+        assert provider._disk_cache is None
+        assert not provider._disk_dirty
+
+    def test_get_year_calendar(self, holiday_provider):
+        """Test the packed weekend and holiday masks for Hamburg 2026."""
+        calendar = holiday_provider.get_year_calendar(2026, Bundesland.HH)
+        holidays = holiday_provider.get_holidays_for_year(2026, Bundesland.HH)
+
+        assert calendar.saturdays.bit_count() == 52
+        assert calendar.sundays.bit_count() == 52
+        assert calendar.holidays.bit_count() == len(holidays)
+        assert calendar.holidays & 1  # Neujahr is day 0
+        assert not calendar.saturdays & calendar.sundays
+
+    def test_get_workday_mask(self, holiday_provider):
+        """Test that the workday bitmap excludes weekends and holidays."""
+        mask = holiday_provider.get_workday_mask(2026, Bundesland.HH)
+        with_saturdays = holiday_provider.get_workday_mask(
+            2026, Bundesland.HH, include_saturdays=True
+        )
+
+        assert not mask & 1  # Neujahr
+        assert mask >> 1 & 1  # Friday, Jan 2
+        assert not mask >> 2 & 1  # Saturday, Jan 3
+        assert with_saturdays >> 2 & 1
+        assert with_saturdays & mask == mask
+
     def test_is_holiday(self, holiday_provider):
         """Test is_holiday method."""
         # January 1st is always a holiday
@@ -111,6 +185,66 @@ class TestLocationResolver:
         with pytest.raises(PydanticValidationError):
             LocationInput(postal_code="1234")  # Too short
 
+    def test_resolve_many(self, location_resolver):
+        """Test batch resolution keeps order and reports failures per item."""
+        results = location_resolver.resolve_many(
+            [
+                LocationInput(postal_code="20095"),
+                LocationInput(),
+                LocationInput(bundesland=Bundesland.BY),
+                LocationInput(postal_code="20095"),
+            ]
+        )
+
+        assert results[0].bundesland == Bundesland.HH
+        assert isinstance(results[1], ValueError)
+        assert results[2].bundesland == Bundesland.BY
+        assert results[3] is results[0]
+
+    def test_geocoding_cache_file(self, tmp_path):
+        """Test that persisted geocoding results are used without a lookup."""
+        cache_file = tmp_path / "geocoding.sqlite"
+        LocationResolver(cache_file=str(cache_file))._store_geocoded(
+            "musterstrasse 1 hamburg", Bundesland.HH
+        )
+
+        resolver = LocationResolver(cache_file=str(cache_file))
+        result = resolver.resolve(LocationInput(address="  Musterstrasse 1   HAMBURG "))
+
+        assert result.bundesland == Bundesland.HH
+        assert result.resolution_method == "geocoding"
+
+    def test_geocoding_paused_after_failures(self):
+        """Test that repeated geocoding errors stop further lookups for a while."""
+
+        class FailingGeocoder:
+            calls = 0
+
+            def geocode(self, *args, **kwargs):
+                FailingGeocoder.calls += 1
+                raise TimeoutError("Nominatim unavailable")
+
+        resolver = LocationResolver()
+        resolver._geolocator = FailingGeocoder()
+
+        for street in ("Weg 1", "Weg 2", "Weg 3"):
+            with pytest.raises(ValueError, match="Could not resolve location"):
+                resolver.resolve(LocationInput(address=street))
+
+        assert FailingGeocoder.calls == 2
+
+    def test_public_nominatim_rate_limited(self):
+        """Test that only a self-hosted Nominatim is queried without a rate limit."""
+        from geopy.extra.rate_limiter import RateLimiter
+
+        public = LocationResolver()
+        assert isinstance(public._get_geocode(), RateLimiter)
+
+        self_hosted = LocationResolver(domain="http://localhost:8080")
+        assert not isinstance(self_hosted._get_geocode(), RateLimiter)
+        assert self_hosted._get_geolocator().domain == "localhost:8080"
+        assert self_hosted._get_geolocator().scheme == "http"
+
     def test_resolve_no_location(self, location_resolver):
         """Test that missing location raises error."""
         location = LocationInput()
@@ -290,6 +424,164 @@ class TestWorkdayCalculatorEdgeCases:
         assert date(2025, 12, 25) in holiday_dates  # 1. Weihnachtstag
         assert date(2026, 1, 1) in holiday_dates    # Neujahr
 
+    def test_workday_response_fields(self, calculator):
+        """Test that a response can be limited to selected fields."""
+        result = calculator.calculate_simple(
+            date(2026, 3, 1), date(2026, 8, 31), bundesland="HH"
+        )
+
+        full = workday_response(result)
+        assert list(full) == list(RESPONSE_FIELDS)
+        assert full["start_date"] == "2026-03-01"
+        assert full["holidays"][0]["date"] == "2026-04-03"
+        assert workday_response(result, ["working_days", "holidays"]) == {
+            "working_days": full["working_days"],
+            "holidays": full["holidays"],
+        }
+        with pytest.raises(ValueError, match="Unknown field: days"):
+            workday_response(result, ["days"])
+
+
+class TestApi:
+    """Tests for the REST API."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a test client for the API."""
+        from fastapi.testclient import TestClient
+
+        from workday_calculator.api import app
+
+        return TestClient(app)
+
+    def test_calculate_if_none_match(self, client):
+        """Test that a matching If-None-Match fails the POST precondition."""
+        body = {"start_date": "2026-03-01", "end_date": "2026-08-31", "postal_code": "20095"}
+        etag = client.post("/calculate", json=body).headers["ETag"]
+
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', f'W/"other",W/{etag}', "*"):
+            response = client.post(
+                "/calculate", json=body, headers={"If-None-Match": if_none_match}
+            )
+            assert response.status_code == 412, if_none_match
+            assert response.headers["ETag"] == etag
+
+        response = client.post("/calculate", json=body, headers={"If-None-Match": '"other"'})
+        assert response.status_code == 200
+        assert response.json()["working_days"] > 0
+
+    def test_calculate_if_none_match_invalid_request(self, client):
+        """Test that an invalid request is rejected even with a matching ETag."""
+        from workday_calculator.api import CalculateRequest, _request_etag
+
+        body = {"start_date": "2026-08-31", "end_date": "2026-03-01", "postal_code": "20095"}
+        etag = _request_etag(CalculateRequest(**body))
+
+        for if_none_match in (etag, "*"):
+            response = client.post(
+                "/calculate", json=body, headers={"If-None-Match": if_none_match}
+            )
+            assert response.status_code == 400, if_none_match
+
+    def test_calculate_batch(self, client, monkeypatch):
+        """Test that a batch keeps request order and resolves each location once."""
+        from workday_calculator import api
+
+        resolved = []
+        resolve_location = api._resolve_location
+
+        def counting_resolve(request):
+            resolved.append(request.postal_code)
+            return resolve_location(request)
+
+        monkeypatch.setattr(api, "_resolve_location", counting_resolve)
+        body = {"start_date": "2026-03-01", "end_date": "2026-08-31", "postal_code": "20095"}
+        response = client.post(
+            "/calculate/batch",
+            json=[
+                body,
+                {**body, "postal_code": "80331"},
+                {**body, "include_saturdays": True},
+            ],
+        )
+
+        assert response.status_code == 200
+        results = response.json()
+        assert [r["bundesland"] for r in results] == ["HH", "BY", "HH"]
+        assert results[2]["working_days"] > results[0]["working_days"]
+        assert resolved == ["20095", "80331"]
+        assert results[0] == client.post("/calculate", json=body).json()
+
+    def test_calculate_batch_invalid_item(self, client):
+        """Test that an invalid item fails the batch with its index."""
+        body = {"start_date": "2026-03-01", "end_date": "2026-08-31", "postal_code": "20095"}
+        response = client.post(
+            "/calculate/batch",
+            json=[body, {**body, "end_date": "2026-01-01"}],
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Item 1: ")
+
+    def test_calculate_batch_too_large(self, client, monkeypatch):
+        """Test that batches above MAX_BATCH_SIZE are rejected."""
+        from workday_calculator import api
+
+        monkeypatch.setattr(api, "MAX_BATCH_SIZE", 2)
+        body = {"start_date": "2026-03-01", "end_date": "2026-08-31", "postal_code": "20095"}
+
+        response = client.post("/calculate/batch", json=[body] * 3)
+        assert response.status_code == 400
+        assert "Batch too large" in response.json()["detail"]
+        assert client.post("/calculate/batch", json=[body] * 2).status_code == 200
+
+
+class TestMcpServer:
+    """Tests for the MCP server tools."""
+
+    @pytest.fixture
+    def mcp_server(self):
+        """Import the MCP server module (needs the mcp package)."""
+        pytest.importorskip("mcp.server.fastmcp")
+        from workday_calculator import mcp_server
+
+        return mcp_server
+
+    def test_calculate_workdays_batch(self, mcp_server):
+        """Test a mixed batch: valid items, bad fields and invalid input."""
+        period = {"start_date": "2026-03-01", "end_date": "2026-08-31"}
+        response = mcp_server._calculate_workdays_batch(
+            [
+                {**period, "postal_code": "20095"},
+                {**period, "plz": "20095"},
+                {**period, "bundesland": "ZZ"},
+                {**period, "end_date": "2026-02-01", "bundesland": "HH"},
+                {**period},
+                {**period, "bundesland": "BY", "include_saturdays": True},
+            ]
+        )
+
+        results = response["results"]
+        assert response["count"] == 6
+        assert results[0]["bundesland"] == "HH"
+        assert results[0]["start_date"] == "2026-03-01"
+        assert results[1]["error"].startswith("Invalid request fields:")
+        assert "error" in results[2]
+        assert "error" in results[3]
+        assert results[4]["error"].startswith("Provide at least one of")
+        assert results[5]["bundesland"] == "BY"
+
+    def test_calculate_workdays_batch_too_large(self, mcp_server):
+        """Test that batches above MAX_BATCH_SIZE are rejected as a whole."""
+        item = {"start_date": "2026-03-01", "end_date": "2026-08-31", "bundesland": "HH"}
+
+        response = mcp_server._calculate_workdays_batch([item] * (mcp_server.MAX_BATCH_SIZE + 1))
+        assert "Batch too large" in response["error"]
+
+        response = mcp_server._calculate_workdays_batch([item] * mcp_server.MAX_BATCH_SIZE)
+        assert response["count"] == mcp_server.MAX_BATCH_SIZE
+        assert all(r["bundesland"] == "HH" for r in response["results"])
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
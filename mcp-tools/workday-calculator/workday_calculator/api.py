@@ -2,10 +2,15 @@
 FastAPI REST API for the workday calculator.
 """
 
+import hashlib
+import re
+from collections import OrderedDict
 from datetime import date
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, Query
+import orjson
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 
 from workday_calculator.config.manager import ConfigManager
@@ -16,10 +21,16 @@ from workday_calculator.data.schemas import (
     Bundesland,
     Holiday,
     LocationInput,
-    WorkdayRequest,
+    LocationResult,
     WorkdayResult,
+    check_plz,
 )
-from workday_calculator.data.bundesland_data import BUNDESLAND_NAMES
+from workday_calculator.data.bundesland_data import (
+    BUNDESLAND_BY_CODE,
+    BUNDESLAND_CODES_CSV,
+    BUNDESLAND_NAMES,
+)
+from workday_calculator.output.response import workday_response
 
 
 # Load configuration
@@ -27,13 +38,45 @@ config_manager = ConfigManager()
 config = config_manager.load_config()
 
 # Initialize components
-holiday_provider = HolidayProvider(language=config.holiday_language)
+holiday_provider = HolidayProvider(
+    language=config.holiday_language, cache_file=config.holiday_cache_file
+)
 location_resolver = LocationResolver(
     geocoding_enabled=config.geocoding_enabled,
     timeout=config.geocoding_timeout,
+    cache_file=config.geocoding_cache_file,
+    domain=config.geocoding_domain,
 )
 calculator = WorkdayCalculator(holiday_provider, location_resolver)
 
+# Maximum number of cached /calculate results
+RESULT_CACHE_SIZE = 4096
+
+# Maximum number of items accepted by /calculate/batch
+MAX_BATCH_SIZE = 1000
+
+# Maximum number of serialized /calculate responses kept by ETag
+RESPONSE_CACHE_SIZE = 4096
+_response_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+@lru_cache(maxsize=RESULT_CACHE_SIZE)
+def _calculate_cached(
+    start_date: date,
+    end_date: date,
+    location: LocationResult,
+    include_saturdays: bool,
+) -> WorkdayResult:
+    """
+    Calculate working days for a resolved location, memoized per process.
+
+    Holidays are static for a given year and Bundesland, so results never
+    need invalidating while the server runs.
+    """
+    return calculator.calculate_for_location(
+        start_date, end_date, location, include_saturdays=include_saturdays
+    )
+
 
 # API Models
 class CalculateRequest(BaseModel):
@@ -97,29 +140,21 @@ async def root():
         "version": "0.1.0",
         "endpoints": {
             "POST /calculate": "Calculate working days",
+            "POST /calculate/batch": "Calculate working days for many requests",
             "GET /holidays/{year}/{bundesland}": "Get holidays for a year",
             "GET /bundeslaender": "List all federal states",
         },
     }
 
 
-@app.post("/calculate", response_model=CalculateResponse)
-async def calculate_workdays(request: CalculateRequest):
+def _resolve_location(request: CalculateRequest) -> LocationResult:
     """
-    Calculate working days between two dates.
+    Validate the location fields of a request and resolve them to a Bundesland.
 
-    Provide location via:
-    - postal_code (PLZ): 5-digit German postal code
-    - bundesland: Federal state code (e.g., HH, BY, NW)
-    - address: Full address for geocoding
+    Raises:
+        HTTPException: If the location is missing or invalid.
+        ValueError: If the location cannot be resolved.
     """
-    # Validate dates
-    if request.end_date < request.start_date:
-        raise HTTPException(
-            status_code=400,
-            detail="end_date must be after or equal to start_date",
-        )
-
     # Validate location
     if not (request.postal_code or request.bundesland or request.address):
         raise HTTPException(
@@ -127,62 +162,162 @@ async def calculate_workdays(request: CalculateRequest):
             detail="Provide at least one of: postal_code, bundesland, or address",
         )
 
-    try:
-        # Build location input
-        bundesland_enum = None
-        if request.bundesland:
-            try:
-                bundesland_enum = Bundesland(request.bundesland.upper())
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid bundesland code: {request.bundesland}. Use one of: {', '.join(b.value for b in Bundesland)}",
-                )
-
-        location = LocationInput(
-            postal_code=request.postal_code,
-            bundesland=bundesland_enum,
-            address=request.address,
-        )
+    # Build location input
+    bundesland_enum = None
+    if request.bundesland:
+        bundesland_enum = BUNDESLAND_BY_CODE.get(request.bundesland.upper())
+        if bundesland_enum is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid bundesland code: {request.bundesland}. Use one of: {BUNDESLAND_CODES_CSV}",
+            )
+
+    # The request fields are already parsed; only the PLZ format is left to check
+    location = LocationInput.model_construct(
+        postal_code=check_plz(request.postal_code),
+        bundesland=bundesland_enum,
+        address=request.address,
+    )
 
-        # Create workday request
-        workday_request = WorkdayRequest(
-            start_date=request.start_date,
-            end_date=request.end_date,
-            location=location,
-            include_saturdays=request.include_saturdays,
+    return location_resolver.resolve(location)
+
+
+def _calculate_request(
+    request: CalculateRequest,
+    resolved_locations: Optional[Dict[tuple, LocationResult]] = None,
+) -> CalculateResponse:
+    """
+    Validate, resolve and calculate a single request.
+
+    Args:
+        request: Incoming calculation request.
+        resolved_locations: Optional memo of already resolved locations, keyed
+            by (postal_code, bundesland, address), shared across a batch.
+
+    Raises:
+        HTTPException: On invalid input (400) or calculation failure (500).
+    """
+    # Validate dates
+    if request.end_date < request.start_date:
+        raise HTTPException(
+            status_code=400,
+            detail="end_date must be after or equal to start_date",
         )
 
+    try:
+        # Resolve first so equivalent locations share a cache entry
+        if resolved_locations is None:
+            resolved = _resolve_location(request)
+        else:
+            key = (request.postal_code, request.bundesland, request.address)
+            resolved = resolved_locations.get(key)
+            if resolved is None:
+                resolved = resolved_locations[key] = _resolve_location(request)
+
         # Calculate
-        result = calculator.calculate(workday_request)
-
-        return CalculateResponse(
-            start_date=result.start_date,
-            end_date=result.end_date,
-            bundesland=result.location.bundesland.value,
-            bundesland_name=result.location.bundesland_name,
-            calendar_days=result.calendar_days,
-            weekend_days=result.weekend_days,
-            saturdays=result.weekends_detail.get("saturdays", 0),
-            sundays=result.weekends_detail.get("sundays", 0),
-            holidays_count=result.holidays_count,
-            working_days=result.working_days,
-            holidays=[
-                {"date": h.holiday_date.isoformat(), "name": h.name, "is_national": h.is_national}
-                for h in result.holidays
-            ],
-            confidence=result.confidence,
-            resolution_method=result.location.resolution_method,
-            warnings=result.warnings,
+        result = _calculate_cached(
+            request.start_date, request.end_date, resolved, request.include_saturdays
         )
 
+        return CalculateResponse(**workday_response(result))
+
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
 
 
-@app.get("/holidays/{year}/{bundesland}", response_model=List[HolidayResponse])
+def _request_etag(request: CalculateRequest) -> str:
+    """Derive a strong ETag from the request body (responses are deterministic)."""
+    digest = hashlib.blake2b(orjson.dumps(request.model_dump()), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+# An entity tag of an If-None-Match list, capturing the opaque tag without W/
+_ENTITY_TAG_RE = re.compile(r'(?:W/)?("[^"]*")')
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against the current ETag.
+
+    The header is a comma-separated list of entity tags or ``*``. Tags are
+    compared weakly (RFC 9110, section 13.1.2): a ``W/`` prefix is ignored.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in _ENTITY_TAG_RE.findall(if_none_match)
+
+
+@app.post("/calculate", response_model=CalculateResponse)
+async def calculate_workdays(
+    request: CalculateRequest,
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Calculate working days between two dates.
+
+    Provide location via:
+    - postal_code (PLZ): 5-digit German postal code
+    - bundesland: Federal state code (e.g., HH, BY, NW)
+    - address: Full address for geocoding
+
+    Responses carry an ETag. The If-None-Match precondition is evaluated
+    after the request has been validated and calculated; as this is a POST,
+    a matching ETag (or ``*``) fails it with 412 Precondition Failed
+    (RFC 9110, section 13.1.2).
+    """
+    etag = _request_etag(request)
+    content = _response_cache.get(etag)
+    if content is None:
+        content = orjson.dumps(_calculate_request(request).model_dump())
+        _response_cache[etag] = content
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    else:
+        _response_cache.move_to_end(etag)
+
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=412, headers={"ETag": etag})
+
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+
+@app.post("/calculate/batch", response_model=List[CalculateResponse])
+async def calculate_workdays_batch(requests: List[CalculateRequest]):
+    """
+    Calculate working days for many date ranges in one call.
+
+    Each item takes the same fields as POST /calculate. Locations are resolved
+    once per distinct input and holiday calendars are shared across the batch.
+    Results are returned in request order; the first invalid item fails the
+    whole batch with its index in the error detail.
+    """
+    if len(requests) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch too large: {len(requests)} items (maximum {MAX_BATCH_SIZE})",
+        )
+
+    resolved_locations: Dict[tuple, LocationResult] = {}
+    responses = []
+    for index, request in enumerate(requests):
+        try:
+            responses.append(_calculate_request(request, resolved_locations))
+        except HTTPException as e:
+            raise HTTPException(status_code=e.status_code, detail=f"Item {index}: {e.detail}")
+    return responses
+
+
+@app.get(
+    "/holidays/{year}/{bundesland}",
+    response_model=None,
+    responses={200: {"model": List[HolidayResponse]}},
+)
 async def get_holidays(
     year: int,
     bundesland: str,
@@ -195,12 +330,11 @@ async def get_holidays(
         bundesland: Bundesland code (e.g., HH, BY, NW)
     """
     # Validate bundesland
-    try:
-        bundesland_enum = Bundesland(bundesland.upper())
-    except ValueError:
+    bundesland_enum = BUNDESLAND_BY_CODE.get(bundesland.upper())
+    if bundesland_enum is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid bundesland code: {bundesland}. Use one of: {', '.join(b.value for b in Bundesland)}",
+            detail=f"Invalid bundesland code: {bundesland}. Use one of: {BUNDESLAND_CODES_CSV}",
         )
 
     # Validate year
@@ -213,28 +347,35 @@ async def get_holidays(
     try:
         holidays = holiday_provider.get_holidays_for_year(year, bundesland_enum)
 
-        return [
-            HolidayResponse(
-                date=h.holiday_date,
-                name=h.name,
-                is_national=h.is_national,
-            )
-            for h in holidays
-        ]
+        # Plain dicts go straight to orjson; HolidayResponse only documents the schema
+        content = orjson.dumps(
+            [
+                {"date": h.holiday_date, "name": h.name, "is_national": h.is_national}
+                for h in holidays
+            ]
+        )
+        return Response(content=content, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching holidays: {str(e)}")
 
 
-@app.get("/bundeslaender", response_model=List[BundeslandInfo])
+# The Bundesland list never changes, so the response body is encoded once
+_BUNDESLAENDER_JSON = orjson.dumps(
+    [{"code": bundesland.value, "name": BUNDESLAND_NAMES[bundesland]} for bundesland in Bundesland]
+)
+
+
+@app.get(
+    "/bundeslaender",
+    response_model=None,
+    responses={200: {"model": List[BundeslandInfo]}},
+)
 async def list_bundeslaender():
     """
     List all German federal states with their codes.
     """
-    return [
-        BundeslandInfo(code=bundesland.value, name=BUNDESLAND_NAMES[bundesland])
-        for bundesland in Bundesland
-    ]
+    return Response(content=_BUNDESLAENDER_JSON, media_type="application/json")
 
 
 @app.get("/health")
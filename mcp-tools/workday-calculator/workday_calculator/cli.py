@@ -2,8 +2,12 @@
 CLI interface for workday calculator.
 """
 
+import os
+import re
 import sys
-from datetime import date, datetime
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import click
 
@@ -11,25 +15,88 @@ from workday_calculator.config.manager import ConfigManager
 from workday_calculator.core.calculator import WorkdayCalculator
 from workday_calculator.core.holiday_provider import HolidayProvider
 from workday_calculator.core.location_resolver import LocationResolver
-from workday_calculator.data.schemas import Bundesland, LocationInput, WorkdayRequest
-from workday_calculator.data.bundesland_data import BUNDESLAND_NAMES
+from workday_calculator.data.schemas import Config, LocationInput, WorkdayRequest
+from workday_calculator.data.bundesland_data import (
+    BUNDESLAND_BY_CODE,
+    BUNDESLAND_CODES,
+    BUNDESLAND_NAMES,
+)
 from workday_calculator.output.formatter import ConsoleFormatter
 from workday_calculator.output.exporter import ResultExporter
 
 
+# YYYY-MM-DD, or DD.MM.YYYY / DD/MM/YYYY (same separator twice)
+_DATE_RE = re.compile(
+    r"(?:(\d{4})-(\d{1,2})-(\d{1,2})|(\d{1,2})([./])(\d{1,2})\5(\d{4}))"
+)
+
+
 def parse_date(date_str: str) -> date:
     """Parse date string in various formats."""
-    formats = ["%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y"]
-    for fmt in formats:
+    match = _DATE_RE.fullmatch(date_str)
+    if match:
+        iso_year, iso_month, iso_day, day, _, month, year = match.groups()
         try:
-            return datetime.strptime(date_str, fmt).date()
+            if iso_year:
+                return date(int(iso_year), int(iso_month), int(iso_day))
+            return date(int(year), int(month), int(day))
         except ValueError:
-            continue
+            pass
     raise ValueError(
         f"Invalid date format: {date_str}. Use YYYY-MM-DD, DD.MM.YYYY, or DD/MM/YYYY"
     )
 
 
+@lru_cache(maxsize=8)
+def _build_stack_cached(
+    config_path: str,
+    config_mtime: Optional[int],
+    env_overrides: Tuple[Tuple[str, str], ...],
+) -> Tuple[Config, WorkdayCalculator]:
+    """
+    Load the configuration and build the calculator stack.
+
+    The modification time and WORKDAY_* overrides only form part of the
+    cache key, so editing the file or the environment yields a fresh stack.
+    """
+    cfg = ConfigManager(config_path).load_config()
+    holiday_provider = HolidayProvider(
+        language=cfg.holiday_language, cache_file=cfg.holiday_cache_file
+    )
+    location_resolver = LocationResolver(
+        geocoding_enabled=cfg.geocoding_enabled,
+        timeout=cfg.geocoding_timeout,
+        cache_file=cfg.geocoding_cache_file,
+        domain=cfg.geocoding_domain,
+    )
+    return cfg, WorkdayCalculator(holiday_provider, location_resolver)
+
+
+def _build_stack(config_path: Optional[str]) -> Tuple[Config, WorkdayCalculator]:
+    """
+    Get the config and calculator stack for a config file.
+
+    Cached per (path, mtime, env overrides), so repeated command invocations
+    in one process (test runners, embedding applications) reuse the same
+    components and their holiday caches until the config changes.
+
+    Args:
+        config_path: Optional path to config file.
+
+    Returns:
+        Tuple of (config, calculator).
+    """
+    resolved_path = ConfigManager(config_path).config_path
+    try:
+        config_mtime = os.stat(resolved_path).st_mtime_ns
+    except OSError:
+        config_mtime = None
+    env_overrides = tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.startswith("WORKDAY_"))
+    )
+    return _build_stack_cached(resolved_path, config_mtime, env_overrides)
+
+
 @click.group()
 @click.version_option(version="0.1.0", prog_name="workday-calc")
 def main():
@@ -54,7 +121,7 @@ def main():
 )
 @click.option(
     "--bundesland", "-b",
-    type=click.Choice([b.value for b in Bundesland], case_sensitive=False),
+    type=click.Choice(BUNDESLAND_CODES, case_sensitive=False),
     help="Bundesland code (e.g., HH, BY, NW)",
 )
 @click.option(
@@ -96,14 +163,13 @@ def calculate(start, end, plz, bundesland, address, include_saturdays, output, f
             formatter.print_error("End date must be after start date")
             sys.exit(1)
 
-        # Load configuration
-        config_manager = ConfigManager(config)
-        cfg = config_manager.load_config()
+        # Load configuration and calculator
+        cfg, calculator = _build_stack(config)
 
         # Create location input
         location = LocationInput(
             postal_code=plz,
-            bundesland=Bundesland(bundesland.upper()) if bundesland else None,
+            bundesland=BUNDESLAND_BY_CODE[bundesland.upper()] if bundesland else None,
             address=address,
         )
 
@@ -117,14 +183,6 @@ def calculate(start, end, plz, bundesland, address, include_saturdays, output, f
                 )
                 sys.exit(1)
 
-        # Create calculator
-        holiday_provider = HolidayProvider(language=cfg.holiday_language)
-        location_resolver = LocationResolver(
-            geocoding_enabled=cfg.geocoding_enabled,
-            timeout=cfg.geocoding_timeout,
-        )
-        calculator = WorkdayCalculator(holiday_provider, location_resolver)
-
         # Create request and calculate
         request = WorkdayRequest(
             start_date=start_date,
@@ -172,7 +230,7 @@ def calculate(start, end, plz, bundesland, address, include_saturdays, output, f
 )
 @click.option(
     "--bundesland", "-b",
-    type=click.Choice([b.value for b in Bundesland], case_sensitive=False),
+    type=click.Choice(BUNDESLAND_CODES, case_sensitive=False),
     required=True,
     help="Bundesland code (e.g., HH, BY, NW)",
 )
@@ -195,14 +253,12 @@ def holidays(year, bundesland, output, config):
         if year is None:
             year = date.today().year
 
-        # Load configuration
-        config_manager = ConfigManager(config)
-        cfg = config_manager.load_config()
+        # Load configuration and calculator
+        cfg, calculator = _build_stack(config)
 
         # Get holidays
-        bundesland_enum = Bundesland(bundesland.upper())
-        holiday_provider = HolidayProvider(language=cfg.holiday_language)
-        holiday_list = holiday_provider.get_holidays_for_year(year, bundesland_enum)
+        bundesland_enum = BUNDESLAND_BY_CODE[bundesland.upper()]
+        holiday_list = calculator.holiday_provider.get_holidays_for_year(year, bundesland_enum)
 
         # Display
         formatter.print_holidays_for_year(year, bundesland_enum, holiday_list)
@@ -6,10 +6,31 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import yaml
-
 from workday_calculator.data.schemas import Bundesland, Config
 
+# YAML section -> {key in section: Config field}
+_SECTION_MAP: Dict[str, Dict[str, str]] = {
+    "location": {
+        "default_bundesland": "default_bundesland",
+        "geocoding_enabled": "geocoding_enabled",
+        "geocoding_timeout": "geocoding_timeout",
+        "geocoding_cache_file": "geocoding_cache_file",
+        "geocoding_domain": "geocoding_domain",
+    },
+    "holidays": {
+        "language": "holiday_language",
+        "cache_file": "holiday_cache_file",
+    },
+    "output": {
+        "format": "output_format",
+        "directory": "output_directory",
+    },
+    "api": {
+        "host": "api_host",
+        "port": "api_port",
+    },
+}
+
 
 class ConfigManager:
     """Manages configuration loading from YAML files and environment variables."""
@@ -22,6 +43,9 @@ class ConfigManager:
             config_path: Optional path to config file. If not provided, uses default.
         """
         self.config_path = config_path or self._get_default_config_path()
+        # Parsed config and the file mtime it was loaded from
+        self._cached: Optional[Config] = None
+        self._cached_mtime: Optional[int] = None
 
     def _get_default_config_path(self) -> str:
         """Get the default configuration file path."""
@@ -32,12 +56,19 @@ class ConfigManager:
         """
         Load configuration from YAML file with environment variable overrides.
 
+        The result is cached on the instance and only re-read when the config
+        file's modification time changes or ``reload()`` is called.
+
         Returns:
             Config: Validated configuration object.
 
         Raises:
             ValueError: If config is invalid.
         """
+        mtime = self._config_mtime()
+        if self._cached is not None and mtime == self._cached_mtime:
+            return self._cached
+
         # 1. Load from YAML file
         config_dict = self._load_yaml()
 
@@ -46,10 +77,31 @@ class ConfigManager:
 
         # 3. Validate and create Config object
         try:
-            return Config(**config_dict)
+            config = Config(**config_dict)
         except Exception as e:
             raise ValueError(f"Invalid configuration: {e}")
 
+        self._cached = config
+        self._cached_mtime = mtime
+        return config
+
+    def reload(self) -> Config:
+        """
+        Discard the cached configuration and load it again.
+
+        Returns:
+            Config: Freshly loaded configuration object.
+        """
+        self._cached = None
+        return self.load_config()
+
+    def _config_mtime(self) -> Optional[int]:
+        """Get the config file's modification time, or None if it is missing."""
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+
     def _load_yaml(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         config_path = Path(self.config_path)
@@ -58,9 +110,16 @@ class ConfigManager:
             # If config file doesn't exist, return empty dict (will use defaults)
             return {}
 
+        # Imported here so that a missing config file never pays for PyYAML
+        import yaml
+
+        # The libyaml-backed loader is much faster; it only exists if PyYAML
+        # was built against libyaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=loader)
                 return self._flatten_config(config) if config else {}
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing YAML config file: {e}")
@@ -76,39 +135,11 @@ class ConfigManager:
             Flattened configuration dictionary.
         """
         result = {}
-
-        # Handle location section
-        if "location" in config:
-            loc = config["location"]
-            if "default_bundesland" in loc:
-                result["default_bundesland"] = loc["default_bundesland"]
-            if "geocoding_enabled" in loc:
-                result["geocoding_enabled"] = loc["geocoding_enabled"]
-            if "geocoding_timeout" in loc:
-                result["geocoding_timeout"] = loc["geocoding_timeout"]
-
-        # Handle holidays section
-        if "holidays" in config:
-            hol = config["holidays"]
-            if "language" in hol:
-                result["holiday_language"] = hol["language"]
-
-        # Handle output section
-        if "output" in config:
-            out = config["output"]
-            if "format" in out:
-                result["output_format"] = out["format"]
-            if "directory" in out:
-                result["output_directory"] = out["directory"]
-
-        # Handle API section
-        if "api" in config:
-            api = config["api"]
-            if "host" in api:
-                result["api_host"] = api["host"]
-            if "port" in api:
-                result["api_port"] = api["port"]
-
+        for section, mapping in _SECTION_MAP.items():
+            values = config.get(section) or {}
+            for key, field in mapping.items():
+                if key in values:
+                    result[field] = values[key]
         return result
 
     def _apply_env_overrides(self, config_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -119,7 +150,10 @@ class ConfigManager:
         - WORKDAY_DEFAULT_BUNDESLAND -> default_bundesland
         - WORKDAY_GEOCODING_ENABLED -> geocoding_enabled
         - WORKDAY_GEOCODING_TIMEOUT -> geocoding_timeout
+        - WORKDAY_GEOCODING_CACHE_FILE -> geocoding_cache_file
+        - WORKDAY_GEOCODING_DOMAIN -> geocoding_domain
         - WORKDAY_HOLIDAY_LANGUAGE -> holiday_language
+        - WORKDAY_HOLIDAY_CACHE_FILE -> holiday_cache_file
         - WORKDAY_OUTPUT_FORMAT -> output_format
         - WORKDAY_OUTPUT_DIRECTORY -> output_directory
         - WORKDAY_API_HOST -> api_host
@@ -135,24 +169,29 @@ class ConfigManager:
             "WORKDAY_DEFAULT_BUNDESLAND": "default_bundesland",
             "WORKDAY_GEOCODING_ENABLED": ("geocoding_enabled", self._parse_bool),
             "WORKDAY_GEOCODING_TIMEOUT": ("geocoding_timeout", int),
+            "WORKDAY_GEOCODING_CACHE_FILE": "geocoding_cache_file",
+            "WORKDAY_GEOCODING_DOMAIN": "geocoding_domain",
             "WORKDAY_HOLIDAY_LANGUAGE": "holiday_language",
+            "WORKDAY_HOLIDAY_CACHE_FILE": "holiday_cache_file",
             "WORKDAY_OUTPUT_FORMAT": "output_format",
             "WORKDAY_OUTPUT_DIRECTORY": "output_directory",
             "WORKDAY_API_HOST": "api_host",
             "WORKDAY_API_PORT": ("api_port", int),
         }
 
-        for env_var, mapping in env_mappings.items():
-            env_value = os.environ.get(env_var)
-            if env_value is not None:
-                if isinstance(mapping, tuple):
-                    config_key, type_converter = mapping
-                    try:
-                        config_dict[config_key] = type_converter(env_value)
-                    except ValueError:
-                        pass  # Skip invalid value
-                else:
-                    config_dict[mapping] = env_value
+        # Only visit the variables that are actually set (usually none)
+        env = os.environ
+        for env_var in sorted(env_mappings.keys() & env.keys()):
+            mapping = env_mappings[env_var]
+            env_value = env[env_var]
+            if isinstance(mapping, tuple):
+                config_key, type_converter = mapping
+                try:
+                    config_dict[config_key] = type_converter(env_value)
+                except ValueError:
+                    pass  # Skip invalid value
+            else:
+                config_dict[mapping] = env_value
 
         return config_dict
 
@@ -175,9 +214,12 @@ class ConfigManager:
                 "default_bundesland": config.default_bundesland.value if config.default_bundesland else None,
                 "geocoding_enabled": config.geocoding_enabled,
                 "geocoding_timeout": config.geocoding_timeout,
+                "geocoding_cache_file": config.geocoding_cache_file,
+                "geocoding_domain": config.geocoding_domain,
             },
             "holidays": {
                 "language": config.holiday_language,
+                "cache_file": config.holiday_cache_file,
             },
             "output": {
                 "format": config.output_format,
@@ -189,8 +231,12 @@ class ConfigManager:
             },
         }
 
+        import yaml
+
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
         # Ensure directory exists
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "w", encoding="utf-8") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_dict, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
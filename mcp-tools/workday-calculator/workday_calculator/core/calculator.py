@@ -2,17 +2,32 @@
 Main workday calculator logic.
 """
 
-from datetime import date, timedelta
-from typing import Set
+from datetime import date, datetime, timezone
+from typing import Optional
 
 from workday_calculator.data.schemas import (
     LocationInput,
+    LocationResult,
     WorkdayRequest,
     WorkdayResult,
 )
+from workday_calculator.data.bundesland_data import BUNDESLAND_BY_CODE
 from workday_calculator.core.holiday_provider import HolidayProvider
 from workday_calculator.core.location_resolver import LocationResolver
 
+# (saturdays, sundays) among the first `remainder` days of a week starting on
+# `weekday`, indexed as _TAIL_WEEKEND_COUNTS[weekday][remainder]
+_TAIL_WEEKEND_COUNTS = tuple(
+    tuple(
+        (
+            sum((weekday + i) % 7 == 5 for i in range(remainder)),
+            sum((weekday + i) % 7 == 6 for i in range(remainder)),
+        )
+        for remainder in range(7)
+    )
+    for weekday in range(7)
+)
+
 
 class WorkdayCalculator:
     """Calculates working days considering weekends and holidays."""
@@ -45,49 +60,72 @@ class WorkdayCalculator:
         # Resolve location to Bundesland
         location = self.location_resolver.resolve(request.location)
 
+        return self.calculate_for_location(
+            request.start_date,
+            request.end_date,
+            location,
+            include_saturdays=request.include_saturdays,
+        )
+
+    def calculate_for_location(
+        self,
+        start_date: date,
+        end_date: date,
+        location: LocationResult,
+        include_saturdays: bool = False,
+        calculation_timestamp: Optional[datetime] = None,
+    ) -> WorkdayResult:
+        """
+        Calculate working days for an already resolved location.
+
+        Args:
+            start_date: Start date of the period.
+            end_date: End date of the period.
+            location: Resolved location.
+            include_saturdays: Whether to count Saturdays as workdays.
+            calculation_timestamp: Optional timestamp to stamp the result with,
+                so batch callers can take the clock once for all results.
+                Defaults to the current UTC time.
+
+        Returns:
+            WorkdayResult with calculated working days and metadata.
+        """
         # Get holidays in the range
         holidays = self.holiday_provider.get_holidays_for_range(
-            request.start_date, request.end_date, location.bundesland
+            start_date, end_date, location.bundesland
         )
-        holiday_dates: Set[date] = {h.holiday_date for h in holidays}
 
         # Calculate calendar days
-        calendar_days = (request.end_date - request.start_date).days + 1
-
-        # Count weekend days
-        saturdays = 0
-        sundays = 0
-        holidays_on_workdays = 0
-
-        current = request.start_date
-        while current <= request.end_date:
-            weekday = current.weekday()
-            if weekday == 5:  # Saturday
-                saturdays += 1
-            elif weekday == 6:  # Sunday
-                sundays += 1
-            current += timedelta(days=1)
-
-        # Count holidays that fall on workdays (not weekends)
-        for hdate in holiday_dates:
-            weekday = hdate.weekday()
-            # If Saturday is a workday, only Sunday is weekend
-            if request.include_saturdays:
-                is_weekend = weekday == 6  # Only Sunday
-            else:
-                is_weekend = weekday in (5, 6)  # Saturday and Sunday
-
-            if not is_weekend:
-                holidays_on_workdays += 1
+        calendar_days = (end_date - start_date).days + 1
+
+        # Count weekend days in closed form: whole weeks plus the partial tail
+        full_weeks, remainder = divmod(calendar_days, 7)
+        tail_saturdays, tail_sundays = _TAIL_WEEKEND_COUNTS[start_date.weekday()][remainder]
+        saturdays = full_weeks + tail_saturdays
+        sundays = full_weeks + tail_sundays
 
         # Calculate weekend days (excluding Saturdays if they're workdays)
-        if request.include_saturdays:
+        if include_saturdays:
             weekend_days = sundays
         else:
             weekend_days = saturdays + sundays
 
-        # Calculate working days
-        working_days = calendar_days - weekend_days - holidays_on_workdays
+        # Count working days via per-year workday bitmaps
+        working_days = 0
+        start_ordinal = start_date.toordinal()
+        end_ordinal = end_date.toordinal()
+
+        for year in range(start_date.year, end_date.year + 1):
+            calendar = self.holiday_provider.get_year_calendar(year, location.bundesland)
+            year_start = calendar.start_ordinal
+            first = max(start_ordinal, year_start)
+            last = min(end_ordinal, year_start + calendar.days - 1)
+            window = ((1 << (last - first + 1)) - 1) << (first - year_start)
+            working_days += (calendar.workdays[include_saturdays] & window).bit_count()
+
+        # Whatever is neither weekend nor a working day is a holiday on a workday
+        # (if Saturday is a workday, holidays on Saturdays cost a workday too)
+        holidays_on_workdays = calendar_days - weekend_days - working_days
 
         # Generate warnings
         warnings = []
@@ -101,8 +139,8 @@ class WorkdayCalculator:
             warnings.append("Calculated working days was negative, set to 0.")
 
         return WorkdayResult(
-            start_date=request.start_date,
-            end_date=request.end_date,
+            start_date=start_date,
+            end_date=end_date,
             location=location,
             calendar_days=calendar_days,
             weekend_days=weekend_days,
@@ -110,6 +148,7 @@ class WorkdayCalculator:
             working_days=working_days,
             holidays=holidays,
             weekends_detail={"saturdays": saturdays, "sundays": sundays},
+            calculation_timestamp=calculation_timestamp or datetime.now(timezone.utc),
             confidence=location.confidence,
             warnings=warnings,
         )
@@ -135,11 +174,15 @@ class WorkdayCalculator:
         Returns:
             WorkdayResult with calculated working days.
         """
-        from workday_calculator.data.schemas import Bundesland as BundeslandEnum
+        bundesland_enum = None
+        if bundesland:
+            bundesland_enum = BUNDESLAND_BY_CODE.get(bundesland)
+            if bundesland_enum is None:
+                raise ValueError(f"{bundesland!r} is not a valid Bundesland")
 
         location_input = LocationInput(
             postal_code=postal_code,
-            bundesland=BundeslandEnum(bundesland) if bundesland else None,
+            bundesland=bundesland_enum,
         )
 
         request = WorkdayRequest(
@@ -2,27 +2,128 @@
 Holiday provider using the holidays library for German federal states.
 """
 
-from datetime import date, timedelta
-from typing import Dict, List, Set
+import atexit
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date
+from importlib import metadata
+from operator import attrgetter
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
-import holidays
+import orjson
+from pydantic import TypeAdapter
 
 from workday_calculator.data.schemas import Bundesland, Holiday
 from workday_calculator.data.bundesland_data import BUNDESLAND_NAMES
 
+if TYPE_CHECKING:
+    import holidays
+
+
+# Bump when the layout of the on-disk holiday cache changes
+CACHE_FORMAT_VERSION = 3
+
+# Maximum number of years kept per cache, including the entries persisted to
+# the cache file (least recently used go first)
+YEAR_CACHE_SIZE = 512
+
+_holiday_date = attrgetter("holiday_date")
+
+# Guards the LRU caches, which MCP tools and resolve_many use from worker threads
+_CACHE_LOCK = threading.Lock()
+
+# Validates a whole year of holiday rows in one call instead of one model at a time
+_HOLIDAY_LIST = TypeAdapter(List[Holiday])
+
+
+class YearCalendar(NamedTuple):
+    """Bit-per-day masks for one year; bit ``n`` stands for day ``n`` of the year (0-based)."""
+
+    # Ordinal of Jan 1 and number of days, so windows need no date objects
+    start_ordinal: int
+    days: int
+    saturdays: int
+    sundays: int
+    holidays: int
+    # Working days (no weekend, no holiday), indexed by include_saturdays:
+    # (Mon-Fri, Mon-Sat)
+    workdays: Tuple[int, int]
+
+
+def _cache_get(cache: "OrderedDict[Any, Any]", key: Any) -> Any:
+    """Look up ``key`` in an LRU cache, marking it as recently used."""
+    with _CACHE_LOCK:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: "OrderedDict[Any, Any]", key: Any, value: Any) -> None:
+    """Store ``value`` in an LRU cache, evicting the oldest entry when full."""
+    with _CACHE_LOCK:
+        cache[key] = value
+        if len(cache) > YEAR_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _holidays_version() -> Optional[str]:
+    """Get the installed holidays version without importing the package."""
+    try:
+        return metadata.version("holidays")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _weekly_mask(first_day: int, days_in_year: int) -> int:
+    """
+    Build a mask with every 7th bit set, starting at ``first_day``.
+
+    Uses the geometric series sum(2**(7*i)) == (2**(7*n) - 1) // (2**7 - 1)
+    so the whole mask comes out of a single big-int division.
+    """
+    weeks = (days_in_year - first_day + 6) // 7
+    return ((1 << (7 * weeks)) - 1) // 0x7F << first_day
+
 
 class HolidayProvider:
     """Provides holiday information for German federal states."""
 
-    def __init__(self, language: str = "de"):
+    def __init__(self, language: str = "de", cache_file: Optional[str] = None):
         """
         Initialize the holiday provider.
 
         Args:
             language: Language for holiday names ('de' or 'en').
+            cache_file: Optional path of a JSON file that persists computed
+                holiday years across process restarts. It is read on the first
+                cache miss and written by ``flush_cache()``, at the end of
+                ``warm_up()`` and at interpreter exit.
         """
         self.language = language
-        self._cache: Dict[tuple, List[Holiday]] = {}
+        self.cache_file = Path(cache_file).expanduser() if cache_file else None
+        # Sorted holidays per (year, Bundesland, language); ranges are sliced from these
+        self._cache: "OrderedDict[Tuple[int, Bundesland, str], List[Holiday]]" = OrderedDict()
+        self._calendar_cache: "OrderedDict[Tuple[int, Bundesland], YearCalendar]" = OrderedDict()
+        self._national_cache: "OrderedDict[int, FrozenSet[date]]" = OrderedDict()
+        # Loaded on the first miss, so a provider that only serves cached years
+        # never imports the holidays package
+        self._disk_cache: "Optional[OrderedDict[Tuple[str, int, str], List[dict]]]" = None
+        self._disk_dirty = False
+        self._flush_registered = False
 
     def get_holidays_for_range(
         self, start: date, end: date, bundesland: Bundesland
@@ -38,35 +139,16 @@ class HolidayProvider:
         Returns:
             List of Holiday objects within the range.
         """
-        cache_key = (start, end, bundesland, self.language)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        # Determine which years to fetch
-        years = set(range(start.year, end.year + 1))
-        subdiv = bundesland.value
-
-        # Create holidays object for the Bundesland
-        de_holidays = holidays.Germany(
-            subdiv=subdiv, language=self.language, years=years
-        )
-
-        result = []
-        current = start
-        while current <= end:
-            if current in de_holidays:
-                holiday_name = de_holidays.get(current)
-                result.append(
-                    Holiday(
-                        holiday_date=current,
-                        name=holiday_name if self.language == "de" else holiday_name,
-                        name_english=holiday_name if self.language == "en" else None,
-                        is_national=self._is_national_holiday(current, de_holidays),
-                    )
-                )
-            current += timedelta(days=1)
-
-        self._cache[cache_key] = result
+        result: List[Holiday] = []
+        for year in range(start.year, end.year + 1):
+            year_holidays = self.get_holidays_for_year(year, bundesland)
+            lo = bisect_left(year_holidays, start, key=_holiday_date) if year == start.year else 0
+            hi = (
+                bisect_right(year_holidays, end, key=_holiday_date)
+                if year == end.year
+                else len(year_holidays)
+            )
+            result.extend(year_holidays[lo:hi])
         return result
 
     def get_holiday_dates(
@@ -97,7 +179,8 @@ class HolidayProvider:
         Returns:
             True if the date is a holiday, False otherwise.
         """
-        return len(self.get_holidays_for_range(check_date, check_date, bundesland)) > 0
+        calendar = self.get_year_calendar(check_date.year, bundesland)
+        return bool(calendar.holidays >> (check_date.toordinal() - calendar.start_ordinal) & 1)
 
     def get_holidays_for_year(self, year: int, bundesland: Bundesland) -> List[Holiday]:
         """
@@ -110,11 +193,132 @@ class HolidayProvider:
         Returns:
             List of Holiday objects for the year.
         """
-        start = date(year, 1, 1)
-        end = date(year, 12, 31)
-        return self.get_holidays_for_range(start, end, bundesland)
+        key = (year, bundesland, self.language)
+        result = _cache_get(self._cache, key)
+        if result is None:
+            disk_key = (self.language, year, bundesland.value)
+            disk_cache = self._get_disk_cache()
+            stored = _cache_get(disk_cache, disk_key)
+            if stored is not None:
+                result = _HOLIDAY_LIST.validate_python(stored)
+            else:
+                result = self._compute_year(year, bundesland)
+                if self.cache_file:
+                    _cache_put(disk_cache, disk_key, [h.model_dump() for h in result])
+                    self._mark_disk_dirty()
+            _cache_put(self._cache, key, result)
+        return result
+
+    def _compute_year(self, year: int, bundesland: Bundesland) -> List[Holiday]:
+        """
+        Compute the sorted holiday list for one year from the holidays library.
+
+        Args:
+            year: Year to compute.
+            bundesland: German federal state.
+
+        Returns:
+            List of Holiday objects for the year, ordered by date.
+        """
+        # Imported on first use: the holidays package is large and most CLI
+        # invocations (help, bundeslaender, cache hits) never need it
+        import holidays
+
+        # Create holidays object for the Bundesland
+        de_holidays = holidays.Germany(
+            subdiv=bundesland.value, language=self.language, years=year
+        )
+
+        # Iterate the holidays themselves instead of probing every day of the year
+        return _HOLIDAY_LIST.validate_python(
+            [
+                {
+                    "holiday_date": holiday_date,
+                    "name": holiday_name if self.language == "de" else holiday_name,
+                    "name_english": holiday_name if self.language == "en" else None,
+                    "is_national": self._is_national_holiday(holiday_date, de_holidays),
+                }
+                for holiday_date, holiday_name in sorted(de_holidays.items())
+            ]
+        )
+
+    def get_year_calendar(self, year: int, bundesland: Bundesland) -> YearCalendar:
+        """
+        Get packed weekend and holiday bitmasks for a specific year.
 
-    def _is_national_holiday(self, check_date: date, state_holidays: holidays.HolidayBase) -> bool:
+        Args:
+            year: Year to build the calendar for.
+            bundesland: German federal state.
+
+        Returns:
+            YearCalendar whose masks can be intersected with a day window
+            and counted with ``int.bit_count()``.
+        """
+        key = (year, bundesland)
+        calendar = _cache_get(self._calendar_cache, key)
+        if calendar is None:
+            # weekday() of Jan 1 tells us the offset of the first Saturday/Sunday
+            year_start = date(year, 1, 1).toordinal()
+            first_weekday = date(year, 1, 1).weekday()
+            days_in_year = date(year + 1, 1, 1).toordinal() - year_start
+
+            holiday_mask = 0
+            for holiday in self.get_holidays_for_year(year, bundesland):
+                holiday_mask |= 1 << (holiday.holiday_date.toordinal() - year_start)
+
+            saturdays = _weekly_mask((5 - first_weekday) % 7, days_in_year)
+            sundays = _weekly_mask((6 - first_weekday) % 7, days_in_year)
+            all_days = (1 << days_in_year) - 1
+            calendar = YearCalendar(
+                start_ordinal=year_start,
+                days=days_in_year,
+                saturdays=saturdays,
+                sundays=sundays,
+                holidays=holiday_mask,
+                workdays=(
+                    all_days & ~(saturdays | sundays | holiday_mask),
+                    all_days & ~(sundays | holiday_mask),
+                ),
+            )
+            _cache_put(self._calendar_cache, key, calendar)
+        return calendar
+
+    def get_workday_mask(
+        self, year: int, bundesland: Bundesland, include_saturdays: bool = False
+    ) -> int:
+        """
+        Get the bitmap of working days for a specific year.
+
+        Args:
+            year: Year to get the bitmap for.
+            bundesland: German federal state.
+            include_saturdays: Whether Saturdays count as workdays.
+
+        Returns:
+            Integer whose bit ``n`` is set if day ``n`` of the year (0-based)
+            is a working day; count a range with ``(mask & window).bit_count()``.
+        """
+        return self.get_year_calendar(year, bundesland).workdays[include_saturdays]
+
+    def warm_up(
+        self, years: Iterable[int], bundeslaender: Iterable[Bundesland] = tuple(Bundesland)
+    ) -> None:
+        """
+        Precompute holidays and year calendars so later lookups hit memory.
+
+        Args:
+            years: Years to precompute.
+            bundeslaender: Federal states to precompute (default: all).
+        """
+        bundeslaender = tuple(bundeslaender)
+        try:
+            for year in years:
+                for bundesland in bundeslaender:
+                    self.get_year_calendar(year, bundesland)
+        finally:
+            self.flush_cache()
+
+    def _is_national_holiday(self, check_date: date, state_holidays: "holidays.HolidayBase") -> bool:
         """
         Determine if a holiday is national (observed in all states).
 
@@ -126,9 +330,91 @@ class HolidayProvider:
             True if it's a national holiday, False if state-specific.
         """
         # Check if the holiday exists in a state with minimal holidays (like Hamburg)
-        national_check = holidays.Germany(subdiv="HH", years=check_date.year)
-        return check_date in national_check
+        year = check_date.year
+        national_dates = _cache_get(self._national_cache, year)
+        if national_dates is None:
+            import holidays
+
+            national_dates = frozenset(holidays.Germany(subdiv="HH", years=year).keys())
+            _cache_put(self._national_cache, year, national_dates)
+        return check_date in national_dates
+
+    def _get_disk_cache(self) -> "OrderedDict[Tuple[str, int, str], List[dict]]":
+        """Get the persisted holiday years, loading the cache file on first use."""
+        if self._disk_cache is None:
+            self._disk_cache = self._load_disk_cache()
+        return self._disk_cache
+
+    def _load_disk_cache(self) -> "OrderedDict[Tuple[str, int, str], List[dict]]":
+        """
+        Load persisted holiday years from the cache file.
+
+        Returns:
+            Mapping of (language, year, bundesland code) to holiday dicts, at
+            most YEAR_CACHE_SIZE entries, or an empty mapping if there is no
+            usable cache file.
+        """
+        entries: "OrderedDict[Tuple[str, int, str], List[dict]]" = OrderedDict()
+        if not self.cache_file or not self.cache_file.exists():
+            return entries
+
+        try:
+            data = orjson.loads(self.cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return entries
+        # Holiday rules change with library releases, so stale caches are dropped
+        version = _holidays_version()
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != CACHE_FORMAT_VERSION
+            or version is None
+            or data.get("holidays_version") != version
+        ):
+            return entries
+        try:
+            for language, year, code, stored in data.get("entries", []):
+                _cache_put(entries, (language, year, code), stored)
+        except (TypeError, ValueError):
+            return OrderedDict()
+        return entries
+
+    def _mark_disk_dirty(self) -> None:
+        """Remember that the cache file is stale and must be written at exit."""
+        self._disk_dirty = True
+        if not self._flush_registered:
+            atexit.register(self.flush_cache)
+            self._flush_registered = True
+
+    def flush_cache(self) -> None:
+        """Write newly computed holiday years to the cache file, if any."""
+        if self._disk_dirty and self.cache_file:
+            self._save_disk_cache()
+
+    def _save_disk_cache(self) -> None:
+        """Write the persisted holiday years to the cache file (best effort)."""
+        data = {
+            "version": CACHE_FORMAT_VERSION,
+            "holidays_version": _holidays_version(),
+            "entries": [
+                [language, year, code, stored]
+                for (language, year, code), stored in self._get_disk_cache().items()
+            ],
+        }
+        tmp_path = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(data))
+            os.replace(tmp_path, self.cache_file)
+            self._disk_dirty = False
+        except OSError:
+            # A read-only or full disk only costs us the persistence
+            pass
 
     def clear_cache(self) -> None:
-        """Clear the holiday cache."""
+        """Clear the holiday caches."""
         self._cache.clear()
+        self._calendar_cache.clear()
+        self._national_cache.clear()
+        # Re-read from the cache file on the next miss; unsaved years are dropped
+        self._disk_cache = None
+        self._disk_dirty = False
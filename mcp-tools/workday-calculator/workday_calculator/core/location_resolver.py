@@ -3,29 +3,134 @@ Location resolver for determining Bundesland from various inputs.
 """
 
 import re
-from typing import Optional
+import sqlite3
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Union
 
 from workday_calculator.data.schemas import Bundesland, LocationInput, LocationResult
 from workday_calculator.data.bundesland_data import (
+    BUNDESLAND_BY_CODE,
     BUNDESLAND_NAMES,
-    PLZ_RANGES,
+    CITY_MAPPING,
+    PLZ_PREFIX_TABLE,
     STATE_NAME_MAPPING,
 )
 
+# Confidence reported for PLZ-based resolution
+PLZ_CONFIDENCE = 0.95
+
+# Prebuilt (frozen) results indexed by the numeric PLZ prefix, so a PLZ
+# lookup is a single tuple index
+_PLZ_RESULTS: tuple[Optional[LocationResult], ...] = tuple(
+    LocationResult(
+        bundesland=bundesland,
+        bundesland_name=BUNDESLAND_NAMES[bundesland],
+        confidence=PLZ_CONFIDENCE,
+        resolution_method="plz",
+    )
+    if bundesland
+    else None
+    for bundesland in PLZ_PREFIX_TABLE
+)
+
+
+@lru_cache(maxsize=128)
+def _location_result(
+    bundesland: Bundesland, confidence: float, method: str
+) -> LocationResult:
+    """Build the (frozen) LocationResult for a resolution, once per combination."""
+    return LocationResult(
+        bundesland=bundesland,
+        bundesland_name=BUNDESLAND_NAMES[bundesland],
+        confidence=confidence,
+        resolution_method=method,
+    )
+
+
+# Maximum number of (city, address) pairs whose fallback resolution is cached
+RESOLVE_CACHE_SIZE = 1024
+
+# How long a persisted geocoding result stays valid
+GEOCODING_CACHE_TTL = 30 * 24 * 3600
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Maximum number of geocoding lookups resolve_many runs at the same time
+# against a self-hosted Nominatim
+GEOCODING_CONCURRENCY = 5
+
+# Minimum delay (seconds) between requests to the public Nominatim, as its
+# usage policy allows at most one request per second
+NOMINATIM_MIN_DELAY = 1.0
+
+# Consecutive geocoding errors after which geocoding is paused, and for how
+# long (seconds), so a degraded Nominatim does not stall every request
+GEOCODING_FAILURE_LIMIT = 2
+GEOCODING_PAUSE = 30
+
+# Maximum number of distinct address strings whose PLZ extraction is cached
+PLZ_EXTRACT_CACHE_SIZE = 8192
+
+_PLZ_RE = re.compile(r"\b(\d{5})\b")
+
+
+@lru_cache(maxsize=PLZ_EXTRACT_CACHE_SIZE)
+def _plz_from_text(text: str) -> Optional[str]:
+    """Return the first 5-digit PLZ in ``text``, memoized per distinct string."""
+    match = _PLZ_RE.search(text)
+    return match.group(1) if match else None
+
+
+def _normalize_address(address: str) -> str:
+    """Normalize an address for cache keys: lowercase, no accents, single spaces."""
+    decomposed = unicodedata.normalize("NFKD", address.lower())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _WHITESPACE_RE.sub(" ", stripped).strip()
+
 
 class LocationResolver:
     """Resolves location inputs to a specific Bundesland."""
 
-    def __init__(self, geocoding_enabled: bool = True, timeout: int = 10):
+    def __init__(
+        self,
+        geocoding_enabled: bool = True,
+        timeout: int = 10,
+        cache_file: Optional[str] = None,
+        domain: Optional[str] = None,
+    ):
         """
         Initialize the location resolver.
 
         Args:
             geocoding_enabled: Whether to enable geocoding for address resolution.
             timeout: Timeout for geocoding requests in seconds.
+            cache_file: Optional path of a SQLite file that persists geocoding
+                results across process restarts.
+            domain: Optional host (e.g. ``http://localhost:8080``) of a
+                self-hosted Nominatim. Without one the public instance is used,
+                sequentially and at most once per NOMINATIM_MIN_DELAY seconds.
         """
         self.geocoding_enabled = geocoding_enabled
         self.timeout = timeout
+        self.cache_file = Path(cache_file).expanduser() if cache_file else None
+        self.domain = domain
+        self._cache_ready = False
+        self._geolocator: Any = None
+        self._geocode: Any = None
+        # Circuit breaker state: consecutive errors and monotonic reopen time,
+        # guarded by a lock since resolve_many geocodes on worker threads
+        self._geocoding_lock = threading.Lock()
+        self._geocoding_failures = 0
+        self._geocoding_paused_until = 0.0
+        # Per instance, since the outcome depends on the geocoding settings
+        self._resolve_fallback = lru_cache(maxsize=RESOLVE_CACHE_SIZE)(
+            self._resolve_from_city_or_address
+        )
 
     def resolve(self, location: LocationInput) -> LocationResult:
         """
@@ -52,19 +157,75 @@ class LocationResolver:
         # Priority 2: PLZ-based resolution
         plz = location.postal_code or self._extract_plz(location.address)
         if plz:
-            bundesland = self._resolve_from_plz(plz)
-            if bundesland:
-                return self._create_result(bundesland, 0.95, "plz")
+            # Non-ASCII digits (str.isdigit() accepts them) land outside 0..99
+            index = (ord(plz[0]) - 48) * 10 + ord(plz[1]) - 48
+            result = _PLZ_RESULTS[index] if 0 <= index < 100 else None
+            if result:
+                return result
+
+        # Priorities 3 and 4, memoized per (city, address)
+        return self._resolve_fallback(location.city, location.address)
+
+    def resolve_many(
+        self, locations: Sequence[LocationInput]
+    ) -> List[Union[LocationResult, ValueError]]:
+        """
+        Resolve several locations, geocoding distinct addresses concurrently.
 
+        Identical inputs are resolved once. With geocoding against a
+        self-hosted Nominatim, the distinct inputs are resolved on up to
+        GEOCODING_CONCURRENCY threads, so N addresses cost about
+        N / GEOCODING_CONCURRENCY round-trips instead of N. The public
+        Nominatim is only queried sequentially.
+
+        Args:
+            locations: Location inputs to resolve.
+
+        Returns:
+            One entry per input, in order: the LocationResult, or the
+            ValueError raised for an input that could not be resolved.
+        """
+        keys = [
+            (loc.bundesland, loc.postal_code, loc.city, loc.address) for loc in locations
+        ]
+        unique = dict(zip(keys, locations))
+
+        def attempt(location: LocationInput) -> Union[LocationResult, ValueError]:
+            try:
+                return self.resolve(location)
+            except ValueError as e:
+                return e
+
+        if self.geocoding_enabled and self.domain and len(unique) > 1:
+            with ThreadPoolExecutor(max_workers=GEOCODING_CONCURRENCY) as pool:
+                results = list(pool.map(attempt, unique.values()))
+        else:
+            results = [attempt(location) for location in unique.values()]
+
+        resolved = dict(zip(unique, results))
+        return [resolved[key] for key in keys]
+
+    def _resolve_from_city_or_address(
+        self, city: Optional[str], address: Optional[str]
+    ) -> LocationResult:
+        """
+        Resolve via city name matching, then geocoding (if enabled).
+
+        Wrapped in a per-instance LRU cache by ``__init__``. Failures raise and
+        are therefore not cached, so a geocoding timeout is retried next time.
+
+        Raises:
+            ValueError: If location cannot be resolved.
+        """
         # Priority 3: City name matching
-        if location.city:
-            bundesland = self._resolve_from_city(location.city)
+        if city:
+            bundesland = self._resolve_from_city(city)
             if bundesland:
                 return self._create_result(bundesland, 0.85, "city")
 
         # Priority 4: Geocoding (if enabled)
-        if self.geocoding_enabled and location.address:
-            bundesland = self._resolve_from_geocoding(location.address)
+        if self.geocoding_enabled and address:
+            bundesland = self._resolve_from_geocoding(address)
             if bundesland:
                 return self._create_result(bundesland, 0.85, "geocoding")
 
@@ -72,21 +233,6 @@ class LocationResolver:
             "Could not resolve location. Provide PLZ, address, or bundesland directly."
         )
 
-    def _resolve_from_plz(self, plz: str) -> Optional[Bundesland]:
-        """
-        Resolve Bundesland from postal code.
-
-        Args:
-            plz: German postal code (5 digits).
-
-        Returns:
-            Bundesland if found, None otherwise.
-        """
-        if len(plz) < 2:
-            return None
-        prefix = plz[:2]
-        return PLZ_RANGES.get(prefix)
-
     def _resolve_from_city(self, city: str) -> Optional[Bundesland]:
         """
         Resolve Bundesland from city name.
@@ -99,55 +245,143 @@ class LocationResolver:
         Returns:
             Bundesland if found, None otherwise.
         """
-        city_lower = city.lower().strip()
-
-        # Major city mappings
-        city_mapping = {
-            "hamburg": Bundesland.HH,
-            "berlin": Bundesland.BE,
-            "bremen": Bundesland.HB,
-            "muenchen": Bundesland.BY,
-            "munich": Bundesland.BY,
-            "koeln": Bundesland.NW,
-            "cologne": Bundesland.NW,
-            "frankfurt": Bundesland.HE,
-            "stuttgart": Bundesland.BW,
-            "duesseldorf": Bundesland.NW,
-            "dortmund": Bundesland.NW,
-            "essen": Bundesland.NW,
-            "leipzig": Bundesland.SN,
-            "dresden": Bundesland.SN,
-            "hannover": Bundesland.NI,
-            "nuernberg": Bundesland.BY,
-            "nuremberg": Bundesland.BY,
-        }
-
-        return city_mapping.get(city_lower)
+        return CITY_MAPPING.get(city.lower().strip())
 
     def _resolve_from_geocoding(self, address: str) -> Optional[Bundesland]:
         """
         Resolve Bundesland using geocoding.
 
+        Results are looked up in and written to the cache file first, if one
+        is configured. After GEOCODING_FAILURE_LIMIT consecutive errors the
+        geocoder is not contacted for GEOCODING_PAUSE seconds; cached results
+        are still served meanwhile. The first lookup after the pause is a
+        trial: one more error pauses geocoding again.
+
         Args:
             address: Address string to geocode.
 
         Returns:
             Bundesland if found, None otherwise.
         """
+        key = _normalize_address(address)
+        bundesland = self._load_geocoded(key)
+        if bundesland:
+            return bundesland
+
+        with self._geocoding_lock:
+            if time.monotonic() < self._geocoding_paused_until:
+                return None
+
         try:
+            location = self._get_geocode()(address + ", Deutschland", addressdetails=True)
+        except Exception:
+            # Geocoding failed, return None
+            with self._geocoding_lock:
+                self._geocoding_failures += 1
+                if self._geocoding_failures >= GEOCODING_FAILURE_LIMIT:
+                    self._geocoding_paused_until = time.monotonic() + GEOCODING_PAUSE
+            return None
+
+        with self._geocoding_lock:
+            self._geocoding_failures = 0
+        if location and "address" in location.raw:
+            state = location.raw["address"].get("state", "")
+            bundesland = self._name_to_bundesland(state)
+
+        if bundesland:
+            self._store_geocoded(key, bundesland)
+        return bundesland
+
+    def _get_geolocator(self) -> Any:
+        """
+        Get the Nominatim geocoder, creating it on first use.
+
+        One instance is kept per resolver so its HTTP adapter (and, with
+        requests installed, its keep-alive session) is reused across lookups.
+        """
+        if self._geolocator is None:
             from geopy.geocoders import Nominatim
 
-            geolocator = Nominatim(user_agent="workday-calculator", timeout=self.timeout)
-            location = geolocator.geocode(
-                address + ", Deutschland", addressdetails=True
+            kwargs: dict = {}
+            if self.domain:
+                scheme, _, host = self.domain.rpartition("://")
+                kwargs = {"domain": host, "scheme": scheme or None}
+            self._geolocator = Nominatim(
+                user_agent="workday-calculator", timeout=self.timeout, **kwargs
             )
-            if location and "address" in location.raw:
-                state = location.raw["address"].get("state", "")
-                return self._name_to_bundesland(state)
-        except Exception:
-            # Geocoding failed, return None
+        return self._geolocator
+
+    def _get_geocode(self) -> Any:
+        """
+        Get the geocode function, creating it on first use.
+
+        Requests to the public Nominatim go through a RateLimiter shared by all
+        threads of this resolver. It neither retries nor swallows errors, so
+        the circuit breaker in ``_resolve_from_geocoding`` still sees them.
+        """
+        # Under the lock, so concurrent first lookups share one RateLimiter
+        with self._geocoding_lock:
+            if self._geocode is None:
+                geocode = self._get_geolocator().geocode
+                if not self.domain:
+                    from geopy.extra.rate_limiter import RateLimiter
+
+                    geocode = RateLimiter(
+                        geocode,
+                        min_delay_seconds=NOMINATIM_MIN_DELAY,
+                        max_retries=0,
+                        swallow_exceptions=False,
+                    )
+                self._geocode = geocode
+        return self._geocode
+
+    def _connect_cache(self) -> sqlite3.Connection:
+        """Open the geocoding cache database, creating it on first use."""
+        if not self._cache_ready:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.cache_file, timeout=self.timeout)
+        if not self._cache_ready:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS geocoding "
+                "(key TEXT PRIMARY KEY, bundesland TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+            self._cache_ready = True
+        return connection
+
+    def _load_geocoded(self, key: str) -> Optional[Bundesland]:
+        """Get a persisted, unexpired geocoding result (best effort)."""
+        if not self.cache_file or not self.cache_file.exists():
+            return None
+        try:
+            connection = self._connect_cache()
+            try:
+                row = connection.execute(
+                    "SELECT bundesland FROM geocoding WHERE key = ? AND ts >= ?",
+                    (key, int(time.time()) - GEOCODING_CACHE_TTL),
+                ).fetchone()
+            finally:
+                connection.close()
+        except (OSError, sqlite3.Error):
+            return None
+        return BUNDESLAND_BY_CODE.get(row[0]) if row else None
+
+    def _store_geocoded(self, key: str, bundesland: Bundesland) -> None:
+        """Persist a geocoding result (best effort)."""
+        if not self.cache_file:
+            return
+        try:
+            connection = self._connect_cache()
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO geocoding (key, bundesland, ts) VALUES (?, ?, ?)",
+                        (key, bundesland.value, int(time.time())),
+                    )
+            finally:
+                connection.close()
+        except (OSError, sqlite3.Error):
+            # A read-only or full disk only costs us the persistence
             pass
-        return None
 
     def _extract_plz(self, text: Optional[str]) -> Optional[str]:
         """
@@ -161,8 +395,7 @@ class LocationResolver:
         """
         if not text:
             return None
-        match = re.search(r"\b(\d{5})\b", text)
-        return match.group(1) if match else None
+        return _plz_from_text(text)
 
     def _name_to_bundesland(self, name: str) -> Optional[Bundesland]:
         """
@@ -189,11 +422,6 @@ class LocationResolver:
             method: Resolution method used.
 
         Returns:
-            LocationResult object.
+            LocationResult object (shared, since results are frozen).
         """
-        return LocationResult(
-            bundesland=bundesland,
-            bundesland_name=BUNDESLAND_NAMES[bundesland],
-            confidence=confidence,
-            resolution_method=method,
-        )
+        return _location_result(bundesland, confidence, method)
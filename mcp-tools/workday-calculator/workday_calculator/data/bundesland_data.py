@@ -2,8 +2,17 @@
 Static data for German federal states (Bundeslaender).
 """
 
+from typing import Optional
+
 from workday_calculator.data.schemas import Bundesland
 
+# Bundesland codes in enum order, for CLI choices and error messages
+BUNDESLAND_CODES: tuple[str, ...] = tuple(b.value for b in Bundesland)
+BUNDESLAND_CODES_CSV = ", ".join(BUNDESLAND_CODES)
+
+# Upper-case code to Bundesland enum, avoiding Enum.__call__ on hot paths
+BUNDESLAND_BY_CODE: dict[str, Bundesland] = {b.value: b for b in Bundesland}
+
 # Full names of Bundeslaender
 BUNDESLAND_NAMES: dict[Bundesland, str] = {
     Bundesland.BB: "Brandenburg",
@@ -126,6 +135,11 @@ PLZ_RANGES: dict[str, Bundesland] = {
     "99": Bundesland.TH,
 }
 
+# PLZ_RANGES as a 100-entry table indexed by the numeric prefix (None = unassigned)
+PLZ_PREFIX_TABLE: tuple[Optional[Bundesland], ...] = tuple(
+    PLZ_RANGES.get(f"{prefix:02d}") for prefix in range(100)
+)
+
 # Mapping from state names to Bundesland enum (lowercase for matching)
 STATE_NAME_MAPPING: dict[str, Bundesland] = {
     "berlin": Bundesland.BE,
@@ -156,3 +170,24 @@ STATE_NAME_MAPPING: dict[str, Bundesland] = {
     "mecklenburg-vorpommern": Bundesland.MV,
     "mecklenburg-western pomerania": Bundesland.MV,
 }
+
+# Major city names to Bundesland enum (lowercase for matching)
+CITY_MAPPING: dict[str, Bundesland] = {
+    "hamburg": Bundesland.HH,
+    "berlin": Bundesland.BE,
+    "bremen": Bundesland.HB,
+    "muenchen": Bundesland.BY,
+    "munich": Bundesland.BY,
+    "koeln": Bundesland.NW,
+    "cologne": Bundesland.NW,
+    "frankfurt": Bundesland.HE,
+    "stuttgart": Bundesland.BW,
+    "duesseldorf": Bundesland.NW,
+    "dortmund": Bundesland.NW,
+    "essen": Bundesland.NW,
+    "leipzig": Bundesland.SN,
+    "dresden": Bundesland.SN,
+    "hannover": Bundesland.NI,
+    "nuernberg": Bundesland.BY,
+    "nuremberg": Bundesland.BY,
+}
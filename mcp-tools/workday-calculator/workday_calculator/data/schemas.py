@@ -2,11 +2,12 @@
 Data models for the workday calculator using Pydantic.
 """
 
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from enum import Enum
+from functools import partial
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class Bundesland(str, Enum):
@@ -30,6 +31,18 @@ class Bundesland(str, Enum):
     TH = "TH"  # Thueringen
 
 
+def check_plz(plz: Optional[str]) -> Optional[str]:
+    """
+    Check German postal code format (5 digits).
+
+    Raises:
+        ValueError: If the PLZ is set but not 5 digits.
+    """
+    if plz and (not plz.isdigit() or len(plz) != 5):
+        raise ValueError("PLZ must be 5 digits")
+    return plz
+
+
 class LocationInput(BaseModel):
     """Input model for location specification."""
 
@@ -42,14 +55,14 @@ class LocationInput(BaseModel):
     @classmethod
     def validate_plz(cls, v: Optional[str]) -> Optional[str]:
         """Validate German postal code format (5 digits)."""
-        if v and (not v.isdigit() or len(v) != 5):
-            raise ValueError("PLZ must be 5 digits")
-        return v
+        return check_plz(v)
 
 
 class Holiday(BaseModel):
     """Represents a public holiday."""
 
+    model_config = ConfigDict(frozen=True)
+
     holiday_date: date = Field(..., description="Date of the holiday")
     name: str = Field(..., description="Name of the holiday in German")
     name_english: Optional[str] = Field(default=None, description="Name in English")
@@ -59,6 +72,8 @@ class Holiday(BaseModel):
 class WorkdayRequest(BaseModel):
     """Request model for workday calculation."""
 
+    model_config = ConfigDict(frozen=True)
+
     start_date: date = Field(..., description="Start date of the period")
     end_date: date = Field(..., description="End date of the period")
     location: LocationInput = Field(..., description="Location for holiday determination")
@@ -76,6 +91,9 @@ class WorkdayRequest(BaseModel):
 class LocationResult(BaseModel):
     """Result of location resolution."""
 
+    # Frozen so resolved locations are hashable and can key result caches
+    model_config = ConfigDict(frozen=True)
+
     bundesland: Bundesland = Field(..., description="Resolved Bundesland")
     bundesland_name: str = Field(..., description="Full name of the Bundesland")
     confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score of resolution")
@@ -85,6 +103,8 @@ class LocationResult(BaseModel):
 class WorkdayResult(BaseModel):
     """Complete result of workday calculation."""
 
+    model_config = ConfigDict(frozen=True)
+
     start_date: date = Field(..., description="Start date of the period")
     end_date: date = Field(..., description="End date of the period")
     location: LocationResult = Field(..., description="Resolved location information")
@@ -97,7 +117,8 @@ class WorkdayResult(BaseModel):
         default_factory=dict, description="Breakdown of Saturdays and Sundays"
     )
     calculation_timestamp: datetime = Field(
-        default_factory=datetime.now, description="When the calculation was performed"
+        default_factory=partial(datetime.now, timezone.utc),
+        description="When the calculation was performed (UTC)",
     )
     confidence: float = Field(..., ge=0.0, le=1.0, description="Overall confidence of calculation")
     warnings: List[str] = Field(default_factory=list, description="Any warnings generated")
@@ -106,12 +127,23 @@ class WorkdayResult(BaseModel):
 class Config(BaseModel):
     """Configuration for the workday calculator."""
 
+    model_config = ConfigDict(frozen=True)
+
     default_bundesland: Optional[Bundesland] = Field(
         default=None, description="Default Bundesland if not specified"
     )
     geocoding_enabled: bool = Field(default=True, description="Enable geocoding for address resolution")
     geocoding_timeout: int = Field(default=10, ge=1, le=60, description="Geocoding timeout in seconds")
+    geocoding_cache_file: Optional[str] = Field(
+        default=None, description="File that persists geocoding results across restarts"
+    )
+    geocoding_domain: Optional[str] = Field(
+        default=None, description="Host of a self-hosted Nominatim (public instance if unset)"
+    )
     holiday_language: str = Field(default="de", description="Language for holiday names")
+    holiday_cache_file: Optional[str] = Field(
+        default=None, description="File that persists computed holidays across restarts"
+    )
     output_format: str = Field(default="json", description="Default output format: json or csv")
     output_directory: str = Field(default="results", description="Directory for output files")
     api_host: str = Field(default="0.0.0.0", description="API server host")
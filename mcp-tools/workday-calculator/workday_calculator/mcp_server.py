@@ -4,15 +4,18 @@ MCP Server for the Workday Calculator.
 This module provides an MCP (Model Context Protocol) server that exposes
 the workday calculator functionality to Claude Desktop and other MCP clients.
 
-Supports two transport modes:
+Supports three transport modes:
 - stdio: For local Claude Desktop integration
 - sse: For HTTP-based integration (Docker, remote servers)
+- streamable-http: For HTTP clients using the newer MCP transport, where
+  each request is a plain HTTP POST instead of a held-open event stream
 """
 
 import argparse
+import asyncio
 import os
 from datetime import date
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from mcp.server.fastmcp import FastMCP
 
@@ -25,33 +28,224 @@ from workday_calculator.data.schemas import (
     LocationInput,
     WorkdayRequest,
 )
-from workday_calculator.data.bundesland_data import BUNDESLAND_NAMES
+from workday_calculator.data.bundesland_data import (
+    BUNDESLAND_BY_CODE,
+    BUNDESLAND_CODES_CSV,
+    BUNDESLAND_NAMES,
+)
+from workday_calculator.output.response import workday_response
 
 # Load configuration
 config_manager = ConfigManager()
 config = config_manager.load_config()
 
 # Initialize components
-holiday_provider = HolidayProvider(language=config.holiday_language)
+holiday_provider = HolidayProvider(
+    language=config.holiday_language, cache_file=config.holiday_cache_file
+)
 location_resolver = LocationResolver(
     geocoding_enabled=config.geocoding_enabled,
     timeout=config.geocoding_timeout,
+    cache_file=config.geocoding_cache_file,
+    domain=config.geocoding_domain,
 )
 calculator = WorkdayCalculator(holiday_provider, location_resolver)
 
+# Maximum number of requests accepted by calculate_workdays_batch
+MAX_BATCH_SIZE = 100
+
+# Years whose holidays are computed for all Bundeslaender when the server starts
+PRECOMPUTED_YEARS = range(2020, 2036)
+
+# Maximum number of tool calls running in worker threads at the same time
+MAX_CONCURRENT_TOOL_CALLS = 50
+_tool_slots = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+
+# list_bundeslaender never changes, so its response is built once and shared
+_BUNDESLAENDER_RESPONSE = {
+    "count": len(Bundesland),
+    "bundeslaender": [
+        {"code": bl.value, "name": BUNDESLAND_NAMES[bl]} for bl in Bundesland
+    ],
+}
+
+
+async def _run_blocking(func: Callable[..., dict], *args: Any) -> dict:
+    """
+    Run a blocking tool body in a worker thread.
+
+    Geocoding does network I/O, so running tool bodies on the event loop would
+    stall every other client of an SSE server; the semaphore bounds how many
+    calls run at once.
+    """
+    async with _tool_slots:
+        return await asyncio.to_thread(func, *args)
+
+
+def _build_request(
+    start_date: str,
+    end_date: str,
+    postal_code: Optional[str] = None,
+    bundesland: Optional[str] = None,
+    address: Optional[str] = None,
+    include_saturdays: bool = False,
+) -> WorkdayRequest:
+    """
+    Validate tool arguments and build a WorkdayRequest.
+
+    Raises:
+        ValueError: With a user-facing message if an argument is invalid.
+    """
+    # Parse dates
+    try:
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+    except ValueError as e:
+        raise ValueError(f"Invalid date format. Use YYYY-MM-DD. Details: {str(e)}")
+
+    # Validate dates
+    if end < start:
+        raise ValueError("end_date must be after or equal to start_date")
+
+    # Validate location
+    if not (postal_code or bundesland or address):
+        raise ValueError("Provide at least one of: postal_code, bundesland, or address")
+
+    # Build location input
+    bundesland_enum = None
+    if bundesland:
+        bundesland_enum = BUNDESLAND_BY_CODE.get(bundesland.upper())
+        if bundesland_enum is None:
+            raise ValueError(
+                f"Invalid bundesland code: {bundesland}. Valid codes: {BUNDESLAND_CODES_CSV}"
+            )
+
+    location = LocationInput(
+        postal_code=postal_code,
+        bundesland=bundesland_enum,
+        address=address,
+    )
+
+    # Create workday request
+    return WorkdayRequest(
+        start_date=start,
+        end_date=end,
+        location=location,
+        include_saturdays=include_saturdays,
+    )
+
+
+def _calculate_workdays(
+    start_date: str,
+    end_date: str,
+    postal_code: Optional[str],
+    bundesland: Optional[str],
+    address: Optional[str],
+    include_saturdays: bool,
+    fields: Optional[List[str]],
+) -> dict:
+    """Blocking body of the calculate_workdays tool."""
+    try:
+        workday_request = _build_request(
+            start_date, end_date, postal_code, bundesland, address, include_saturdays
+        )
+
+        # Calculate
+        result = calculator.calculate(workday_request)
+
+        return workday_response(result, fields)
+
+    except ValueError as e:
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": f"Calculation error: {str(e)}"}
+
+
+def _calculate_workdays_batch(requests: List[Dict[str, Any]]) -> dict:
+    """Blocking body of the calculate_workdays_batch tool."""
+    if len(requests) > MAX_BATCH_SIZE:
+        return {"error": f"Batch too large: {len(requests)} items (maximum {MAX_BATCH_SIZE})"}
+
+    results: List[Dict[str, Any]] = [{} for _ in requests]
+    pending: List[tuple] = []
+    for index, item in enumerate(requests):
+        try:
+            pending.append((index, _build_request(**item)))
+        except TypeError as e:
+            results[index] = {"error": f"Invalid request fields: {str(e)}"}
+        except ValueError as e:
+            results[index] = {"error": str(e)}
+
+    locations = location_resolver.resolve_many(
+        [workday_request.location for _, workday_request in pending]
+    )
+    for (index, workday_request), location in zip(pending, locations):
+        if isinstance(location, ValueError):
+            results[index] = {"error": str(location)}
+            continue
+        try:
+            result = calculator.calculate_for_location(
+                workday_request.start_date,
+                workday_request.end_date,
+                location,
+                include_saturdays=workday_request.include_saturdays,
+            )
+            results[index] = workday_response(result)
+        except Exception as e:
+            results[index] = {"error": f"Calculation error: {str(e)}"}
+
+    return {"count": len(results), "results": results}
+
+
+def _get_holidays(year: int, bundesland: str) -> dict:
+    """Blocking body of the get_holidays tool."""
+    # Validate bundesland
+    bundesland_enum = BUNDESLAND_BY_CODE.get(bundesland.upper())
+    if bundesland_enum is None:
+        return {"error": f"Invalid bundesland code: {bundesland}. Valid codes: {BUNDESLAND_CODES_CSV}"}
+
+    # Validate year
+    if year < 1900 or year > 2100:
+        return {"error": "Year must be between 1900 and 2100"}
+
+    try:
+        holidays = holiday_provider.get_holidays_for_year(year, bundesland_enum)
+
+        return {
+            "year": year,
+            "bundesland": bundesland_enum.value,
+            "bundesland_name": BUNDESLAND_NAMES[bundesland_enum],
+            "holiday_count": len(holidays),
+            "holidays": [
+                {
+                    "date": h.holiday_date.isoformat(),
+                    "name": h.name,
+                    "is_national": h.is_national,
+                }
+                for h in holidays
+            ],
+        }
+
+    except Exception as e:
+        return {"error": f"Error fetching holidays: {str(e)}"}
+
 
 def create_mcp_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
     """Create and configure the MCP server with tools."""
+    # Precompute common years up front so tool calls only do cache lookups
+    holiday_provider.warm_up(PRECOMPUTED_YEARS)
+
     mcp = FastMCP("Workday Calculator", host=host, port=port)
 
     @mcp.tool()
-    def calculate_workdays(
+    async def calculate_workdays(
         start_date: str,
         end_date: str,
         postal_code: Optional[str] = None,
         bundesland: Optional[str] = None,
         address: Optional[str] = None,
         include_saturdays: bool = False,
+        fields: Optional[List[str]] = None,
     ) -> dict:
         """
         Calculate working days between two dates for a German location.
@@ -67,6 +261,8 @@ def create_mcp_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
             bundesland: Bundesland code (e.g., "HH" for Hamburg, "BY" for Bayern)
             address: Full address for geocoding (optional fallback)
             include_saturdays: Whether to count Saturdays as work days (default: False)
+            fields: Only return these response fields (e.g., ["working_days"]).
+                Request just what you need; omit to get the full response.
 
         Returns:
             Dictionary with calculation results including:
@@ -84,76 +280,51 @@ def create_mcp_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
 
             Calculate workdays for Bayern using Bundesland code:
             >>> calculate_workdays("2026-03-01", "2026-08-31", bundesland="BY")
-        """
-        # Parse dates
-        try:
-            start = date.fromisoformat(start_date)
-            end = date.fromisoformat(end_date)
-        except ValueError as e:
-            return {"error": f"Invalid date format. Use YYYY-MM-DD. Details: {str(e)}"}
 
-        # Validate dates
-        if end < start:
-            return {"error": "end_date must be after or equal to start_date"}
-
-        # Validate location
-        if not (postal_code or bundesland or address):
-            return {"error": "Provide at least one of: postal_code, bundesland, or address"}
+            Only get the number of working days:
+            >>> calculate_workdays("2026-03-01", "2026-08-31", bundesland="BY", fields=["working_days"])
+        """
+        return await _run_blocking(
+            _calculate_workdays,
+            start_date,
+            end_date,
+            postal_code,
+            bundesland,
+            address,
+            include_saturdays,
+            fields,
+        )
 
-        try:
-            # Build location input
-            bundesland_enum = None
-            if bundesland:
-                try:
-                    bundesland_enum = Bundesland(bundesland.upper())
-                except ValueError:
-                    valid_codes = ", ".join(b.value for b in Bundesland)
-                    return {"error": f"Invalid bundesland code: {bundesland}. Valid codes: {valid_codes}"}
-
-            location = LocationInput(
-                postal_code=postal_code,
-                bundesland=bundesland_enum,
-                address=address,
-            )
+    @mcp.tool()
+    async def calculate_workdays_batch(requests: List[Dict[str, Any]]) -> dict:
+        """
+        Calculate working days for several periods and locations in one call.
 
-            # Create workday request
-            workday_request = WorkdayRequest(
-                start_date=start,
-                end_date=end,
-                location=location,
-                include_saturdays=include_saturdays,
-            )
+        Prefer this over repeated calculate_workdays calls when comparing many
+        locations: identical locations are resolved only once, and distinct
+        addresses are geocoded concurrently against a self-hosted Nominatim.
 
-            # Calculate
-            result = calculator.calculate(workday_request)
-
-            return {
-                "working_days": result.working_days,
-                "calendar_days": result.calendar_days,
-                "weekend_days": result.weekend_days,
-                "saturdays": result.weekends_detail.get("saturdays", 0),
-                "sundays": result.weekends_detail.get("sundays", 0),
-                "holidays_count": result.holidays_count,
-                "holidays": [
-                    {"date": h.holiday_date.isoformat(), "name": h.name, "is_national": h.is_national}
-                    for h in result.holidays
-                ],
-                "start_date": result.start_date.isoformat(),
-                "end_date": result.end_date.isoformat(),
-                "bundesland": result.location.bundesland.value,
-                "bundesland_name": result.location.bundesland_name,
-                "confidence": result.confidence,
-                "resolution_method": result.location.resolution_method,
-                "warnings": result.warnings,
-            }
+        Args:
+            requests: List of request objects, each with the same fields as
+                calculate_workdays (start_date, end_date, postal_code,
+                bundesland, address, include_saturdays). At most 100 items.
 
-        except ValueError as e:
-            return {"error": str(e)}
-        except Exception as e:
-            return {"error": f"Calculation error: {str(e)}"}
+        Returns:
+            Dictionary with:
+            - count: Number of results
+            - results: One entry per request, in order, shaped like the
+              calculate_workdays response (or {"error": ...} on failure)
+
+        Example:
+            >>> calculate_workdays_batch([
+            ...     {"start_date": "2026-03-01", "end_date": "2026-08-31", "postal_code": "20095"},
+            ...     {"start_date": "2026-03-01", "end_date": "2026-08-31", "bundesland": "BY"},
+            ... ])
+        """
+        return await _run_blocking(_calculate_workdays_batch, requests)
 
     @mcp.tool()
-    def get_holidays(year: int, bundesland: str) -> dict:
+    async def get_holidays(year: int, bundesland: str) -> dict:
         """
         Get all public holidays for a specific year and German federal state.
 
@@ -176,37 +347,7 @@ def create_mcp_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
             Get holidays for Hamburg in 2026:
             >>> get_holidays(2026, "HH")
         """
-        # Validate bundesland
-        try:
-            bundesland_enum = Bundesland(bundesland.upper())
-        except ValueError:
-            valid_codes = ", ".join(b.value for b in Bundesland)
-            return {"error": f"Invalid bundesland code: {bundesland}. Valid codes: {valid_codes}"}
-
-        # Validate year
-        if year < 1900 or year > 2100:
-            return {"error": "Year must be between 1900 and 2100"}
-
-        try:
-            holidays = holiday_provider.get_holidays_for_year(year, bundesland_enum)
-
-            return {
-                "year": year,
-                "bundesland": bundesland_enum.value,
-                "bundesland_name": BUNDESLAND_NAMES[bundesland_enum],
-                "holiday_count": len(holidays),
-                "holidays": [
-                    {
-                        "date": h.holiday_date.isoformat(),
-                        "name": h.name,
-                        "is_national": h.is_national,
-                    }
-                    for h in holidays
-                ],
-            }
-
-        except Exception as e:
-            return {"error": f"Error fetching holidays: {str(e)}"}
+        return await _run_blocking(_get_holidays, year, bundesland)
 
     @mcp.tool()
     def list_bundeslaender() -> dict:
@@ -239,13 +380,7 @@ def create_mcp_server(host: str = "127.0.0.1", port: int = 8000) -> FastMCP:
             - ST: Sachsen-Anhalt
             - TH: Thüringen
         """
-        return {
-            "count": len(Bundesland),
-            "bundeslaender": [
-                {"code": bl.value, "name": BUNDESLAND_NAMES[bl]}
-                for bl in Bundesland
-            ],
-        }
+        return _BUNDESLAENDER_RESPONSE
 
     return mcp
 
@@ -255,25 +390,25 @@ def main():
 
     Transport can be set via:
     - Command line: --transport sse --port 8080
-    - Environment: MCP_TRANSPORT=sse MCP_PORT=8080 MCP_HOST=0.0.0.0
+    - Environment: MCP_TRANSPORT=streamable-http MCP_PORT=8080 MCP_HOST=0.0.0.0
     """
     parser = argparse.ArgumentParser(description="Workday Calculator MCP Server")
     parser.add_argument(
         "--transport",
-        choices=["stdio", "sse"],
+        choices=["stdio", "sse", "streamable-http"],
         default=os.environ.get("MCP_TRANSPORT", "stdio"),
-        help="Transport mode: stdio (default) or sse for HTTP",
+        help="Transport mode: stdio (default), sse or streamable-http for HTTP",
     )
     parser.add_argument(
         "--host",
         default=os.environ.get("MCP_HOST", os.environ.get("FASTMCP_HOST", "0.0.0.0")),
-        help="Host to bind to (SSE mode only, default: 0.0.0.0)",
+        help="Host to bind to (HTTP modes only, default: 0.0.0.0)",
     )
     parser.add_argument(
         "--port",
         type=int,
         default=int(os.environ.get("MCP_PORT", os.environ.get("FASTMCP_PORT", "8080"))),
-        help="Port to listen on (SSE mode only, default: 8080)",
+        help="Port to listen on (HTTP modes only, default: 8080)",
     )
 
     args = parser.parse_args()
@@ -284,6 +419,9 @@ def main():
     if args.transport == "sse":
         # Run with SSE transport for HTTP access
         mcp.run(transport="sse")
+    elif args.transport == "streamable-http":
+        # Run with streamable HTTP transport (endpoint: /mcp)
+        mcp.run(transport="streamable-http")
     else:
         # Run with stdio transport for Claude Desktop
         mcp.run(transport="stdio")
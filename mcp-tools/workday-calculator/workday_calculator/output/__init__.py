@@ -4,5 +4,6 @@ Output formatting and export functionality.
 
 from workday_calculator.output.formatter import ConsoleFormatter
 from workday_calculator.output.exporter import ResultExporter
+from workday_calculator.output.response import RESPONSE_FIELDS, workday_response
 
-__all__ = ["ConsoleFormatter", "ResultExporter"]
+__all__ = ["ConsoleFormatter", "ResultExporter", "RESPONSE_FIELDS", "workday_response"]
@@ -3,11 +3,12 @@ Export functionality for workday calculation results.
 """
 
 import csv
-import json
 from datetime import date, datetime
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import orjson
+
 from workday_calculator.data.schemas import Holiday, WorkdayResult
 
 
@@ -61,11 +62,10 @@ class ResultExporter:
             filename = self._generate_filename("workdays", "json")
             file_path = output_dir / filename
 
-        # Convert result to JSON-serializable dict
+        # Convert result to a dict; orjson serializes the dates natively
         result_dict = self._result_to_dict(result)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(result_dict, f, indent=2, ensure_ascii=False)
+        file_path.write_bytes(orjson.dumps(result_dict, option=orjson.OPT_INDENT_2))
 
         return str(file_path)
 
@@ -154,13 +154,10 @@ class ResultExporter:
             # Write header
             writer.writerow(["Date", "Name", "Is National"])
 
-            # Write data
-            for holiday in holidays:
-                writer.writerow([
-                    holiday.date.isoformat(),
-                    holiday.name,
-                    holiday.is_national,
-                ])
+            # Write data in one call; the csv module iterates the rows in C
+            writer.writerows(
+                [(h.holiday_date.isoformat(), h.name, h.is_national) for h in holidays]
+            )
 
         return str(file_path)
 
@@ -182,7 +179,10 @@ class ResultExporter:
 
     def _result_to_dict(self, result: WorkdayResult) -> dict:
         """
-        Convert WorkdayResult to a JSON-serializable dictionary.
+        Convert WorkdayResult to a dictionary for orjson serialization.
+
+        Dates and timestamps are kept as objects; orjson writes them in ISO
+        8601 format.
 
         Args:
             result: WorkdayResult to convert.
@@ -191,8 +191,8 @@ class ResultExporter:
             Dictionary representation.
         """
         return {
-            "start_date": result.start_date.isoformat(),
-            "end_date": result.end_date.isoformat(),
+            "start_date": result.start_date,
+            "end_date": result.end_date,
             "location": {
                 "bundesland": result.location.bundesland.value,
                 "bundesland_name": result.location.bundesland_name,
@@ -208,14 +208,14 @@ class ResultExporter:
             },
             "holidays": [
                 {
-                    "date": h.date.isoformat(),
+                    "date": h.holiday_date,
                     "name": h.name,
                     "is_national": h.is_national,
                 }
                 for h in result.holidays
             ],
             "metadata": {
-                "calculation_timestamp": result.calculation_timestamp.isoformat(),
+                "calculation_timestamp": result.calculation_timestamp,
                 "confidence": result.confidence,
                 "warnings": result.warnings,
             },
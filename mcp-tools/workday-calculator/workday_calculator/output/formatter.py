@@ -2,6 +2,7 @@
 Console output formatting using Rich.
 """
 
+from datetime import date
 from typing import List
 
 from rich.console import Console
@@ -12,6 +13,14 @@ from rich.text import Text
 from workday_calculator.data.schemas import Bundesland, Holiday, WorkdayResult
 from workday_calculator.data.bundesland_data import BUNDESLAND_NAMES
 
+# English weekday names indexed by date.weekday()
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def _format_date_de(value: date) -> str:
+    """Format a date as DD.MM.YYYY without going through strftime."""
+    return f"{value.day:02d}.{value.month:02d}.{value.year}"
+
 
 class ConsoleFormatter:
     """Formats output for console display using Rich."""
@@ -39,7 +48,7 @@ class ConsoleFormatter:
 
         summary_table.add_row(
             "Period:",
-            f"{result.start_date.strftime('%d.%m.%Y')} - {result.end_date.strftime('%d.%m.%Y')}",
+            f"{_format_date_de(result.start_date)} - {_format_date_de(result.end_date)}",
         )
         summary_table.add_row(
             "Location:",
@@ -99,13 +108,11 @@ class ConsoleFormatter:
         holiday_table.add_column("Day", style="dim", width=12)
         holiday_table.add_column("Name", style="white")
 
-        weekday_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
         for holiday in holidays:
-            weekday = weekday_names[holiday.date.weekday()]
+            holiday_date = holiday.holiday_date
             holiday_table.add_row(
-                holiday.date.strftime("%d.%m.%Y"),
-                weekday,
+                _format_date_de(holiday_date),
+                WEEKDAY_NAMES[holiday_date.weekday()],
                 holiday.name,
             )
 
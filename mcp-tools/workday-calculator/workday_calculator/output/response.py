@@ -0,0 +1,66 @@
+"""
+Response payloads shared by the MCP server and the REST API.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from workday_calculator.data.schemas import WorkdayResult
+
+
+def _holidays(result: WorkdayResult) -> List[Dict[str, Any]]:
+    """Build the holidays list of a calculation response."""
+    return [
+        {"date": h.holiday_date.isoformat(), "name": h.name, "is_national": h.is_national}
+        for h in result.holidays
+    ]
+
+
+# Builder per response field, for callers that only want some of them
+_FIELD_BUILDERS: Dict[str, Callable[[WorkdayResult], Any]] = {
+    "working_days": lambda r: r.working_days,
+    "calendar_days": lambda r: r.calendar_days,
+    "weekend_days": lambda r: r.weekend_days,
+    "saturdays": lambda r: r.weekends_detail.get("saturdays", 0),
+    "sundays": lambda r: r.weekends_detail.get("sundays", 0),
+    "holidays_count": lambda r: r.holidays_count,
+    "holidays": _holidays,
+    "start_date": lambda r: r.start_date.isoformat(),
+    "end_date": lambda r: r.end_date.isoformat(),
+    "bundesland": lambda r: r.location.bundesland.value,
+    "bundesland_name": lambda r: r.location.bundesland_name,
+    "confidence": lambda r: r.confidence,
+    "resolution_method": lambda r: r.location.resolution_method,
+    "warnings": lambda r: r.warnings,
+}
+
+# Names of the fields of a calculation response, in response order
+RESPONSE_FIELDS = tuple(_FIELD_BUILDERS)
+
+
+def workday_response(
+    result: WorkdayResult, fields: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """
+    Flatten a WorkdayResult into the calculation response payload.
+
+    Dates are ISO 8601 strings, so the payload is plain JSON for MCP clients.
+
+    Args:
+        result: WorkdayResult to convert.
+        fields: Optional names of the fields to include (see RESPONSE_FIELDS);
+            None includes all of them.
+
+    Returns:
+        Dictionary with the fields of a calculation response.
+
+    Raises:
+        ValueError: If ``fields`` names an unknown field.
+    """
+    if fields is None:
+        return {name: build(result) for name, build in _FIELD_BUILDERS.items()}
+    try:
+        return {name: _FIELD_BUILDERS[name](result) for name in fields}
+    except KeyError as e:
+        raise ValueError(
+            f"Unknown field: {e.args[0]}. Valid fields: {', '.join(RESPONSE_FIELDS)}"
+        ) from None
@@ -3,8 +3,9 @@ Configuration module for the content scraping and retrieval system.
 Loads settings from environment variables with sensible defaults.
 """
 
+import functools
 import os
-from typing import List
+from typing import Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -14,9 +15,11 @@ load_dotenv()
 QDRANT_HOST = os.getenv("QDRANT_HOST", "localhost")
 QDRANT_PORT = int(os.getenv("QDRANT_PORT", "6333"))
 COLLECTION_NAME = os.getenv("COLLECTION_NAME", "htwg_knowledge_base")
+QDRANT_BATCH_SIZE = int(os.getenv("QDRANT_BATCH_SIZE", "256"))  # points per upload request
+QDRANT_PARALLEL = int(os.getenv("QDRANT_PARALLEL", "1"))  # upload processes (>1 pays off for large uploads)
 
 # Embedding Backend Configuration
-EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "sentence-transformers")  # Options: "sentence-transformers", "ollama"
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "sentence-transformers")  # Options: "sentence-transformers", "onnx", "ollama"
 
 # Sentence Transformers Configuration
 EMBEDDING_MODEL = os.getenv(
@@ -24,29 +27,44 @@ EMBEDDING_MODEL = os.getenv(
     "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
 )
 
+# CPU threads for Sentence Transformers encoding (0 = PyTorch default: one per physical core).
+# Set this in containers, where PyTorch sees the host's cores rather than the CPU limit.
+TORCH_NUM_THREADS = int(os.getenv("TORCH_NUM_THREADS", "0"))
+# Run Sentence Transformers in half precision when a CUDA GPU is used
+EMBEDDING_FP16 = os.getenv("EMBEDDING_FP16", "false").lower() == "true"
+
+# ONNX Runtime Configuration (EMBEDDING_BACKEND=onnx, exports EMBEDDING_MODEL)
+ONNX_MODEL_DIR = os.getenv("ONNX_MODEL_DIR", "onnx_models")
+ONNX_QUANTIZE = os.getenv("ONNX_QUANTIZE", "true").lower() == "true"  # int8 dynamic quantization
+
 # Ollama Configuration
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "nomic-embed-text")  # for embeddings
 OLLAMA_LLM_MODEL = os.getenv("OLLAMA_LLM_MODEL", "mistral:instruct")  # for chat/generate (test_simple_response.py)
+OLLAMA_EMBED_BATCH_SIZE = int(os.getenv("OLLAMA_EMBED_BATCH_SIZE", "32"))  # texts per /api/embed request
+OLLAMA_CONCURRENCY = int(os.getenv("OLLAMA_CONCURRENCY", "4"))  # embedding requests in flight at once
 
 # Chunking Configuration
 CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "500"))
 CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "50"))
 
+# Number of source URLs fetched at the same time
+MAX_CONCURRENT_FETCHES = int(os.getenv("MAX_CONCURRENT_FETCHES", "8"))
+
 # Data Source URLs
-def get_source_urls() -> List[str]:
+@functools.cache
+def get_source_urls() -> Tuple[str, ...]:
     """
-    Get list of URLs to scrape from environment variable.
-    Returns a list of URLs, split by comma.
+    Get the URLs to scrape from the SOURCE_URLS environment variable.
+    Returns a tuple of URLs, split by comma. Parsed once per process.
     """
     urls_str = os.getenv("SOURCE_URLS", "")
     if not urls_str:
         # Default URL if none specified
-        return ["https://www.htwg-konstanz.de/hochschule/fakultaeten/informatik/studium/praxissemester-bachelor"]
+        return ("https://www.htwg-konstanz.de/hochschule/fakultaeten/informatik/studium/praxissemester-bachelor",)
     
     # Split by comma and strip whitespace
-    urls = [url.strip() for url in urls_str.split(",") if url.strip()]
-    return urls
+    return tuple(url for url in map(str.strip, urls_str.split(",")) if url)
 
 SOURCE_URLS = get_source_urls()
 
@@ -56,7 +74,7 @@ if __name__ == "__main__":
     print(f"Qdrant Host: {QDRANT_HOST}:{QDRANT_PORT}")
     print(f"Collection: {COLLECTION_NAME}")
     print(f"Embedding Backend: {EMBEDDING_BACKEND}")
-    if EMBEDDING_BACKEND == "sentence-transformers":
+    if EMBEDDING_BACKEND in ("sentence-transformers", "onnx"):
         print(f"Embedding Model: {EMBEDDING_MODEL}")
     elif EMBEDDING_BACKEND == "ollama":
         print(f"Ollama Host: {OLLAMA_HOST}")
@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """
 Embedding module that supports multiple backends.
-Provides a unified interface for creating embeddings using either
-Sentence Transformers or Ollama.
+Provides a unified interface for creating embeddings using
+Sentence Transformers, ONNX Runtime or Ollama.
 """
 
 from typing import List, Union
 import numpy as np
 import config
 
+# Texts per ONNX Runtime inference call
+ONNX_BATCH_SIZE = 32
+
 
 class EmbeddingModel:
     """Unified interface for embedding models."""
@@ -17,9 +20,17 @@ class EmbeddingModel:
         """Initialize the embedding model based on configuration."""
         self.backend = config.EMBEDDING_BACKEND
         self.model = None
+        self.tokenizer = None
+        # Token limit for the ONNX backend, matching Sentence Transformers
+        self.max_seq_length = None
+        self._session = None
+        # Cleared once Ollama turns out not to support the batch endpoint
+        self._ollama_batch_endpoint = True
         
         if self.backend == "sentence-transformers":
             self._init_sentence_transformers()
+        elif self.backend == "onnx":
+            self._init_onnx()
         elif self.backend == "ollama":
             self._init_ollama()
         else:
@@ -27,20 +38,99 @@ class EmbeddingModel:
     
     def _init_sentence_transformers(self):
         """Initialize Sentence Transformers model."""
+        import torch
         from sentence_transformers import SentenceTransformer
+        
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        
+        # Only matters for CPU encoding
+        if config.TORCH_NUM_THREADS > 0 and device == "cpu":
+            torch.set_num_threads(config.TORCH_NUM_THREADS)
+            print(f"  Using {config.TORCH_NUM_THREADS} CPU threads")
+        
         print(f"  Loading Sentence Transformers model: {config.EMBEDDING_MODEL}")
-        self.model = SentenceTransformer(config.EMBEDDING_MODEL)
-        print(f"  ✓ Model loaded")
+        self.model = SentenceTransformer(config.EMBEDDING_MODEL, device=device)
+        if device == "cuda" and config.EMBEDDING_FP16:
+            self.model.half()
+        print(f"  ✓ Model loaded on {device}{' (fp16)' if device == 'cuda' and config.EMBEDDING_FP16 else ''}")
+    
+    def _init_onnx(self):
+        """
+        Initialize the embedding model on ONNX Runtime.
+        
+        The model is exported from EMBEDDING_MODEL on first use and, with
+        ONNX_QUANTIZE, dynamically quantized to int8. The result is kept in
+        ONNX_MODEL_DIR so later runs load it directly.
+        
+        Texts are truncated at the max_seq_length from the model's
+        sentence_bert_config.json, like Sentence Transformers does, so both
+        backends produce the same vectors for long chunks.
+        """
+        import json
+        import shutil
+        from pathlib import Path
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+        
+        model_dir = Path(config.ONNX_MODEL_DIR) / config.EMBEDDING_MODEL.replace("/", "__")
+        file_name = "model_quantized.onnx" if config.ONNX_QUANTIZE else "model.onnx"
+        print(f"  Loading ONNX model: {config.EMBEDDING_MODEL}")
+        
+        if not (model_dir / file_name).exists():
+            print(f"  Exporting model to {model_dir} (first run only)...")
+            model = ORTModelForFeatureExtraction.from_pretrained(config.EMBEDDING_MODEL, export=True)
+            model.save_pretrained(model_dir)
+            AutoTokenizer.from_pretrained(config.EMBEDDING_MODEL).save_pretrained(model_dir)
+            if config.ONNX_QUANTIZE:
+                quantizer = ORTQuantizer.from_pretrained(model)
+                quantizer.quantize(
+                    save_dir=model_dir,
+                    quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+                )
+        
+        st_config = model_dir / "sentence_bert_config.json"
+        if not st_config.exists():
+            try:
+                source = Path(config.EMBEDDING_MODEL) / st_config.name
+                if not source.exists():
+                    from huggingface_hub import hf_hub_download
+                    source = hf_hub_download(config.EMBEDDING_MODEL, st_config.name)
+                shutil.copy(source, st_config)
+            except Exception:
+                print("  ⚠ No sentence_bert_config.json, truncating at the tokenizer limit")
+        
+        self.model = ORTModelForFeatureExtraction.from_pretrained(model_dir, file_name=file_name)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        if st_config.exists():
+            self.max_seq_length = json.loads(st_config.read_text()).get("max_seq_length")
+        self.max_seq_length = self.max_seq_length or self.tokenizer.model_max_length
+        print(f"  ✓ Model loaded{' (int8)' if config.ONNX_QUANTIZE else ''}")
     
     def _init_ollama(self):
         """Initialize Ollama client."""
         import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
         print(f"  Connecting to Ollama at {config.OLLAMA_HOST}")
         print(f"  Using model: {config.OLLAMA_MODEL}")
         
+        # One keep-alive session for all requests, so each embedding call
+        # doesn't open a new connection; transient 5xx errors are retried
+        self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=None,
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
         # Test connection
         try:
-            response = requests.get(f"{config.OLLAMA_HOST}/api/tags", timeout=5)
+            response = self._session.get(f"{config.OLLAMA_HOST}/api/tags", timeout=5)
             response.raise_for_status()
             print(f"  ✓ Connected to Ollama")
         except Exception as e:
@@ -67,6 +157,8 @@ class EmbeddingModel:
         # Get embeddings based on backend
         if self.backend == "sentence-transformers":
             embeddings = self._encode_sentence_transformers(texts, show_progress_bar)
+        elif self.backend == "onnx":
+            embeddings = self._encode_onnx(texts, show_progress_bar)
         elif self.backend == "ollama":
             embeddings = self._encode_ollama(texts, show_progress_bar)
         else:
@@ -81,31 +173,107 @@ class EmbeddingModel:
         """Encode texts using Sentence Transformers."""
         return self.model.encode(texts, show_progress_bar=show_progress_bar)
     
+    def _encode_onnx(self, texts: List[str], show_progress_bar: bool) -> np.ndarray:
+        """
+        Encode texts using the ONNX Runtime model.
+        
+        Mean-pools the token embeddings like the Sentence Transformers
+        pooling layer; texts are batched in order of length to keep padding low.
+        """
+        from tqdm import tqdm
+        
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        starts = range(0, len(texts), ONNX_BATCH_SIZE)
+        iterator = tqdm(starts, desc="Creating embeddings") if show_progress_bar else starts
+        
+        embeddings = []
+        for start in iterator:
+            batch = [texts[i] for i in order[start:start + ONNX_BATCH_SIZE]]
+            inputs = self.tokenizer(
+                batch, padding=True, truncation=True, max_length=self.max_seq_length, return_tensors="np"
+            )
+            token_embeddings = self.model(**inputs).last_hidden_state
+            mask = inputs["attention_mask"][..., None].astype(token_embeddings.dtype)
+            embeddings.append((token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None))
+        
+        sorted_embeddings = np.concatenate(embeddings) if embeddings else np.empty((0, 0), dtype=np.float32)
+        result = np.empty_like(sorted_embeddings)
+        result[order] = sorted_embeddings
+        return result
+    
     def _encode_ollama(self, texts: List[str], show_progress_bar: bool) -> np.ndarray:
-        """Encode texts using Ollama."""
-        import requests
+        """
+        Encode texts using Ollama.
+        
+        Sends OLLAMA_EMBED_BATCH_SIZE texts per request to the batch endpoint
+        /api/embed, with up to OLLAMA_CONCURRENCY requests in flight. Ollama
+        versions without it get one /api/embeddings request per text instead.
+        
+        Texts are batched in order of length, so each batch holds texts of
+        similar size, and the embeddings are put back in input order.
+        (Sentence Transformers already does this inside encode().)
+        """
+        from concurrent.futures import ThreadPoolExecutor
         from tqdm import tqdm
         
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        sorted_texts = [texts[i] for i in order]
+        batch_size = config.OLLAMA_EMBED_BATCH_SIZE
+        batches = [sorted_texts[i:i + batch_size] for i in range(0, len(sorted_texts), batch_size)]
+        
         embeddings = []
-        iterator = tqdm(texts, desc="Creating embeddings") if show_progress_bar else texts
+        with ThreadPoolExecutor(max_workers=config.OLLAMA_CONCURRENCY) as executor:
+            # map() yields results in input order
+            results = executor.map(self._embed_ollama_batch, batches)
+            if show_progress_bar:
+                results = tqdm(results, total=len(batches), desc="Creating embeddings")
+            for batch_embeddings in results:
+                embeddings.extend(batch_embeddings)
         
-        for text in iterator:
+        sorted_embeddings = np.array(embeddings)
+        result = np.empty_like(sorted_embeddings)
+        result[order] = sorted_embeddings
+        return result
+    
+    def _embed_ollama_batch(self, batch: List[str]) -> List[List[float]]:
+        """Embed one batch of texts with a single Ollama request."""
+        if self._ollama_batch_endpoint:
             try:
-                response = requests.post(
-                    f"{config.OLLAMA_HOST}/api/embeddings",
+                response = self._session.post(
+                    f"{config.OLLAMA_HOST}/api/embed",
                     json={
                         "model": config.OLLAMA_MODEL,
-                        "prompt": text
+                        "input": batch
                     },
-                    timeout=30
+                    timeout=60
                 )
-                response.raise_for_status()
-                embedding = response.json()["embedding"]
-                embeddings.append(embedding)
+                # Older Ollama versions don't know /api/embed
+                if response.status_code != 404:
+                    response.raise_for_status()
+                    embeddings = response.json().get("embeddings")
+                    if embeddings is not None:
+                        return embeddings
             except Exception as e:
-                raise RuntimeError(f"Failed to get embedding from Ollama: {e}")
+                raise RuntimeError(f"Failed to get embeddings from Ollama: {e}")
+            self._ollama_batch_endpoint = False
         
-        return np.array(embeddings)
+        return [self._embed_ollama_text(text) for text in batch]
+    
+    def _embed_ollama_text(self, text: str) -> List[float]:
+        """Embed a single text via the legacy /api/embeddings endpoint."""
+        try:
+            response = self._session.post(
+                f"{config.OLLAMA_HOST}/api/embeddings",
+                json={
+                    "model": config.OLLAMA_MODEL,
+                    "prompt": text
+                },
+                timeout=30
+            )
+            response.raise_for_status()
+            return response.json()["embedding"]
+        except Exception as e:
+            raise RuntimeError(f"Failed to get embedding from Ollama: {e}")
     
     def get_dimension(self) -> int:
         """
@@ -119,7 +287,7 @@ class EmbeddingModel:
         return len(test_embedding)
 
 
-def create_embeddings(texts: List[str], model: EmbeddingModel) -> List[List[float]]:
+def create_embeddings(texts: List[str], model: EmbeddingModel) -> np.ndarray:
     """
     Create embeddings for text chunks.
     
@@ -128,11 +296,10 @@ def create_embeddings(texts: List[str], model: EmbeddingModel) -> List[List[floa
         model: EmbeddingModel instance
     
     Returns:
-        List of embedding vectors
+        numpy array with one embedding vector per row
     """
     print(f"  Creating embeddings for {len(texts)} chunks...")
-    embeddings = model.encode(texts, show_progress_bar=True)
-    return embeddings.tolist()
+    return model.encode(texts, show_progress_bar=True)
 
 
 if __name__ == "__main__":
@@ -5,19 +5,28 @@ Fetches content from multiple URLs, creates embeddings, and stores in Qdrant.
 Includes duplicate detection and incremental updates.
 """
 
+import re
 import requests
 import hashlib
 import uuid
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct
-from typing import List, Dict, Set
+from typing import Iterator, List, Dict, Set
 from urllib.parse import urlparse
 import config
 from embeddings import EmbeddingModel, create_embeddings
 from semantic_chunking import chunk_by_headings
 
 
+# Whitespace cleanup patterns for fetched page text, compiled once
+_MULTI_SPACE_RE = re.compile(r' +')
+_MULTI_NEWLINE_RE = re.compile(r'\n+')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r' +([.,;:!?])')
+
+
 def generate_content_hash(text: str) -> str:
     """Generate a unique hash for content to detect duplicates."""
     return hashlib.sha256(text.encode('utf-8')).hexdigest()
@@ -36,7 +45,7 @@ def fetch_website_content(url: str) -> tuple[str, str, str]:
         # Store original HTML for semantic chunking
         html_content = response.content
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Remove script and style elements only (keep nav for now, might have content)
         for script in soup(["script", "style"]):
@@ -61,13 +70,12 @@ def fetch_website_content(url: str) -> tuple[str, str, str]:
         text = soup.get_text(separator=' ', strip=True)
         
         # Clean up excessive whitespace while preserving sentence structure
-        import re
         # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
+        text = _MULTI_SPACE_RE.sub(' ', text)
         # Replace multiple newlines with single newline
-        text = re.sub(r'\n+', '\n', text)
+        text = _MULTI_NEWLINE_RE.sub('\n', text)
         # Remove spaces before punctuation
-        text = re.sub(r' +([.,;:!?])', r'\1', text)
+        text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
         
         print(f"    ✓ Fetched {len(text)} characters")
         return text, html_content, url
@@ -173,15 +181,16 @@ def get_existing_hashes(client: QdrantClient, collection_name: str) -> Set[str]:
             return set()
         
         # Scroll through all points and collect hashes
+        # (only the content_hash field is transferred, not text and metadata)
         existing_hashes = set()
         offset = None
         
         while True:
             result = client.scroll(
                 collection_name=collection_name,
-                limit=100,
+                limit=1000,
                 offset=offset,
-                with_payload=True,
+                with_payload=["content_hash"],
                 with_vectors=False
             )
             
@@ -204,9 +213,43 @@ def get_existing_hashes(client: QdrantClient, collection_name: str) -> Set[str]:
 
 
 
+def build_points(chunks: List[Dict[str, str]], embeddings: np.ndarray) -> Iterator[PointStruct]:
+    """
+    Yield a Qdrant point per chunk, with an ID derived from its content hash.
+    Embedding rows are converted to lists one point at a time.
+    """
+    for chunk, embedding in zip(chunks, embeddings):
+        # Generate UUID from content hash for consistent, valid IDs
+        # This ensures the same content always gets the same UUID
+        point_id = str(uuid.UUID(chunk["content_hash"][:32]))
+        
+        # Build payload with metadata
+        payload = {
+            "text": chunk["text"],
+            "source_url": chunk["source_url"],
+            "source_domain": chunk["source_domain"],
+            "chunk_index": chunk["chunk_index"],
+            "content_hash": chunk["content_hash"]
+        }
+        
+        # Add heading if present (from semantic chunking)
+        if "heading" in chunk and chunk["heading"]:
+            payload["heading"] = chunk["heading"]
+        
+        # Add document_id if present
+        if "document_id" in chunk:
+            payload["document_id"] = chunk["document_id"]
+        
+        yield PointStruct(
+            id=point_id,
+            vector=embedding.tolist(),
+            payload=payload
+        )
+
+
 def store_in_qdrant(
     chunks: List[Dict[str, str]], 
-    embeddings: List[List[float]], 
+    embeddings: np.ndarray, 
     client: QdrantClient,
     collection_name: str,
     existing_hashes: Set[str],
@@ -217,13 +260,13 @@ def store_in_qdrant(
     
     Args:
         chunks: List of chunk dictionaries
-        embeddings: List of embedding vectors
+        embeddings: Array with one embedding vector per row
         client: Qdrant client instance
         collection_name: Name of the collection
         existing_hashes: Set of existing content hashes
         force_recreate: If True, recreate collection from scratch
     """
-    vector_size = len(embeddings[0])
+    vector_size = embeddings.shape[1]
     
     # Create or recreate collection
     if force_recreate:
@@ -257,15 +300,16 @@ def store_in_qdrant(
     
     # Filter out duplicates (delta loading)
     new_chunks = []
-    new_embeddings = []
+    new_indices = []
     duplicate_count = 0
     
-    for chunk, embedding in zip(chunks, embeddings):
+    for index, chunk in enumerate(chunks):
         if chunk["content_hash"] in existing_hashes:
             duplicate_count += 1
         else:
             new_chunks.append(chunk)
-            new_embeddings.append(embedding)
+            new_indices.append(index)
+    new_embeddings = embeddings[new_indices]
     
     if duplicate_count > 0:
         print(f"  ℹ Skipped {duplicate_count} duplicate chunks (already in database)")
@@ -274,42 +318,14 @@ def store_in_qdrant(
         print(f"  ℹ No new chunks to upload (all content already exists)")
         return
     
-    # Prepare points for upload
-    points = []
-    for chunk, embedding in zip(new_chunks, new_embeddings):
-        # Generate UUID from content hash for consistent, valid IDs
-        # This ensures the same content always gets the same UUID
-        point_id = str(uuid.UUID(chunk["content_hash"][:32]))
-        
-        # Build payload with metadata
-        payload = {
-            "text": chunk["text"],
-            "source_url": chunk["source_url"],
-            "source_domain": chunk["source_domain"],
-            "chunk_index": chunk["chunk_index"],
-            "content_hash": chunk["content_hash"]
-        }
-        
-        # Add heading if present (from semantic chunking)
-        if "heading" in chunk and chunk["heading"]:
-            payload["heading"] = chunk["heading"]
-        
-        # Add document_id if present
-        if "document_id" in chunk:
-            payload["document_id"] = chunk["document_id"]
-        
-        point = PointStruct(
-            id=point_id,
-            vector=embedding,
-            payload=payload
-        )
-        points.append(point)
-    
-    # Upload to Qdrant
-    print(f"  Uploading {len(points)} new chunks to Qdrant...")
-    client.upsert(
+    # Upload to Qdrant in batches; points are built lazily as batches are sent
+    print(f"  Uploading {len(new_chunks)} new chunks to Qdrant...")
+    client.upload_points(
         collection_name=collection_name,
-        points=points
+        points=build_points(new_chunks, new_embeddings),
+        batch_size=config.QDRANT_BATCH_SIZE,
+        parallel=config.QDRANT_PARALLEL,
+        wait=True
     )
     print(f"  ✓ Upload complete!")
 
@@ -331,7 +347,7 @@ def main(force_recreate: bool = False):
     print(f"  Collection: {config.COLLECTION_NAME}")
     print(f"  Qdrant: {config.QDRANT_HOST}:{config.QDRANT_PORT}")
     print(f"  Embedding Backend: {config.EMBEDDING_BACKEND}")
-    if config.EMBEDDING_BACKEND == "sentence-transformers":
+    if config.EMBEDDING_BACKEND in ("sentence-transformers", "onnx"):
         print(f"  Model: {config.EMBEDDING_MODEL}")
     elif config.EMBEDDING_BACKEND == "ollama":
         print(f"  Ollama Host: {config.OLLAMA_HOST}")
@@ -358,10 +374,11 @@ def main(force_recreate: bool = False):
     # 1. Fetch content from all URLs
     print(f"Fetching content from {len(config.SOURCE_URLS)} URL(s)...")
     all_content = []
-    for url in config.SOURCE_URLS:
-        text_content, html_content, source_url = fetch_website_content(url)
-        if text_content:
-            all_content.append((text_content, html_content, source_url))
+    # Fetches are network-bound, so a few run at once; map() keeps URL order
+    with ThreadPoolExecutor(max_workers=config.MAX_CONCURRENT_FETCHES) as executor:
+        for text_content, html_content, source_url in executor.map(fetch_website_content, config.SOURCE_URLS):
+            if text_content:
+                all_content.append((text_content, html_content, source_url))
     print(f"  ✓ Successfully fetched {len(all_content)} source(s)")
     print()
     
@@ -411,7 +428,7 @@ def main(force_recreate: bool = False):
     # 4. Create embeddings
     texts = [chunk["text"] for chunk in all_chunks]
     embeddings = create_embeddings(texts, model)
-    print(f"  ✓ Created {len(embeddings)} embeddings (dimension: {len(embeddings[0])})")
+    print(f"  ✓ Created {len(embeddings)} embeddings (dimension: {embeddings.shape[1]})")
     print()
     
     # 5. Store in Qdrant
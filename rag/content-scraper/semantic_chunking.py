@@ -177,7 +177,10 @@ def _split_large_section(text: str, heading: str, target_size: int, max_size: in
     # Try to split by sentences
     sentences = text.split('. ')
     
-    current_chunk = ""
+    # Sentences of the current chunk, joined with spaces only when it is
+    # saved; current_length is the length of that joined string
+    current_chunk = []
+    current_length = 0
     for i, sentence in enumerate(sentences):
         sentence = sentence.strip()
         if not sentence:
@@ -188,28 +191,32 @@ def _split_large_section(text: str, heading: str, target_size: int, max_size: in
             sentence += '.'
         
         # If adding this sentence exceeds target AND we have content, save current chunk
-        if current_chunk and len(current_chunk) + len(sentence) > target_size:
+        if current_chunk and current_length + len(sentence) > target_size:
             # But if current chunk is still under max_size, we can continue a bit
-            if len(current_chunk) < max_size:
+            if current_length < max_size:
                 # Add sentence if total doesn't exceed max_size
-                if len(current_chunk) + len(sentence) <= max_size:
-                    current_chunk += " " + sentence
+                if current_length + len(sentence) <= max_size:
+                    current_chunk.append(sentence)
+                    current_length += 1 + len(sentence)
                     continue
             
             # Save current chunk and start new one
-            chunks.append(current_chunk.strip())
-            current_chunk = sentence
+            chunks.append(" ".join(current_chunk))
+            current_chunk = [sentence]
+            current_length = len(sentence)
         else:
-            current_chunk += " " + sentence if current_chunk else sentence
+            current_length += 1 + len(sentence) if current_chunk else len(sentence)
+            current_chunk.append(sentence)
         
         # If current chunk itself exceeds max_size, force split
-        if len(current_chunk) > max_size:
-            chunks.append(current_chunk.strip())
-            current_chunk = ""
+        if current_length > max_size:
+            chunks.append(" ".join(current_chunk))
+            current_chunk = []
+            current_length = 0
     
     # Add last chunk
     if current_chunk:
-        chunks.append(current_chunk.strip())
+        chunks.append(" ".join(current_chunk))
     
     return chunks if chunks else [text]
 
@@ -25,7 +25,7 @@ def retrieve_context(query: str, top_k: int = 3) -> list:
     # Load model
     print(f"Loading embedding model...")
     print(f"  Backend: {config.EMBEDDING_BACKEND}")
-    if config.EMBEDDING_BACKEND == "sentence-transformers":
+    if config.EMBEDDING_BACKEND in ("sentence-transformers", "onnx"):
         print(f"  Model: {config.EMBEDDING_MODEL}")
     elif config.EMBEDDING_BACKEND == "ollama":
         print(f"  Ollama: {config.OLLAMA_HOST}")
@@ -128,7 +128,7 @@ def test_multiple_queries():
     print(f"\nConfiguration:")
     print(f"  Collection: {config.COLLECTION_NAME}")
     print(f"  Backend: {config.EMBEDDING_BACKEND}")
-    if config.EMBEDDING_BACKEND == "sentence-transformers":
+    if config.EMBEDDING_BACKEND in ("sentence-transformers", "onnx"):
         print(f"  Model: {config.EMBEDDING_MODEL}")
     elif config.EMBEDDING_BACKEND == "ollama":
         print(f"  Ollama Host: {config.OLLAMA_HOST}")